@@ -1,30 +1,88 @@
 import asyncio
 import discord
+from collections import deque
+import importlib
+import platform
 from pathlib import Path
-from typing import AsyncIterator
+from typing import AsyncIterator, Callable, Iterable
 
 from .config import load_config
-from .exceptions import ConfigurationError
+from .exceptions import ConfigurationError, ReconnectExhaustedError
 from .message import SmartMessage
+from .ratelimit import TokenBucket
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Event loop policies tried in order when event_loop_policy="auto"
+_LOOP_POLICY_ORDER = ("uringcore", "uvloop")
+_LOOP_POLICY_NAMES = frozenset({"auto", *_LOOP_POLICY_ORDER})
+
+
+def _kernel_supports_io_uring() -> bool:
+    """Check whether the running kernel is Linux >= 5.11 (required by uringcore)."""
+    if platform.system() != "Linux":
+        return False
+    try:
+        major, minor = (int(part) for part in platform.release().split(".")[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (5, 11)
+
+
+def _install_event_loop_policy(name: str) -> str:
+    """Install a faster asyncio event loop policy if it is available.
+
+    Args:
+        name: "uringcore", "uvloop" or "auto" (try uringcore, then uvloop)
+
+    Returns:
+        The name of the installed policy, or "asyncio" if none could be installed
+
+    Raises:
+        ConfigurationError: If name is not one of the supported policies
+    """
+    if name not in _LOOP_POLICY_NAMES:
+        raise ConfigurationError(
+            f"Unknown event loop policy '{name}', expected one of: "
+            f"{', '.join(sorted(_LOOP_POLICY_NAMES))}"
+        )
+    candidates = _LOOP_POLICY_ORDER if name == "auto" else (name,)
+
+    for candidate in candidates:
+        if candidate == "uringcore" and not _kernel_supports_io_uring():
+            logger.debug("uringcore requires Linux kernel >= 5.11, skipping")
+            continue
+        try:
+            module = importlib.import_module(candidate)
+        except ImportError:
+            logger.debug("Event loop policy '%s' is not installed", candidate)
+            continue
+        policy_class = getattr(module, "EventLoopPolicy", None)
+        if policy_class is None:
+            logger.debug("Module '%s' does not provide an EventLoopPolicy", candidate)
+            continue
+        asyncio.set_event_loop_policy(policy_class())
+        return candidate
+
+    logger.warning("Event loop policy '%s' unavailable, using default asyncio loop", name)
+    return "asyncio"
+
 
 class BridgeClient(discord.Client):
-    """Custom Discord client that bridges to the Bridge class."""
+    """Custom Discord client that bridges to the Bridge class.
+
+    The Bridge's event handlers are installed as instance attributes, so
+    discord.py dispatches events straight to them without an intermediate
+    coroutine per event.
+    """
 
     def __init__(self, bridge: "Bridge", *args, **kwargs):
         self._bridge = bridge
         super().__init__(*args, **kwargs)
-
-    async def on_ready(self):
-        """Called when the bot is ready."""
-        await self._bridge._handle_on_ready()
-
-    async def on_message(self, message: discord.Message):
-        """Called when a message is received."""
-        await self._bridge._handle_on_message(message)
+        # discord.py looks up on_<event> on the instance at dispatch time
+        self.on_ready = bridge._handle_on_ready
+        self.on_message = bridge._handle_on_message
 
 
 class Bridge:
@@ -41,37 +99,82 @@ class Bridge:
         ...     await message.reply(f"You said: {message.content}")
     """
 
-    def __init__(self, config_path: str) -> None:
+    # Incoming messages are queued in small batches to amortize queue wakeups:
+    # a batch is flushed when it is full or BATCH_LINGER seconds after its first message
+    BATCH_MAX_SIZE: int = 32
+    BATCH_LINGER: float = 0.005
+
+    # Number of reconnection attempts allowed back-to-back. After that the
+    # delay starts at reconnect_base_delay and doubles on every attempt, up
+    # to MAX_RECONNECT_DELAY seconds
+    RECONNECT_BURST: int = 2
+    MAX_RECONNECT_DELAY: float = 60.0
+
+    # Maximum number of recycled SmartMessage objects kept for reuse
+    MESSAGE_POOL_SIZE: int = 256
+
+    def __init__(
+        self,
+        config_path: str,
+        event_loop_policy: str | None = None,
+        recycle_messages: bool = False,
+    ) -> None:
         """Initialize the Bridge with configuration.
 
         Args:
             config_path: Path to the YAML configuration file
+            event_loop_policy: Optional faster event loop to install: "uvloop",
+                "uringcore" (Linux kernel >= 5.11 only) or "auto". Falls back to
+                the default asyncio loop if the package is not installed. The
+                policy only applies to loops created afterwards, so construct
+                the Bridge before calling asyncio.run() to benefit from it.
+            recycle_messages: Reuse SmartMessage objects yielded by listen()
+                instead of allocating one per message. Only enable this if you
+                never keep a reference to a message past its loop iteration
+                (e.g. by passing it to asyncio.create_task()).
 
         Raises:
-            ConfigurationError: If config file is not found or invalid
+            ConfigurationError: If config file is not found or invalid, or if
+                event_loop_policy is not a supported policy name
         """
         self.config_path = config_path
+        self.event_loop_policy = event_loop_policy
+        self.recycle_messages = recycle_messages
 
         # Load configuration
         try:
             config_result = load_config(Path(self.config_path))
             self.token = config_result[0]
-            self.prefix = config_result[1]
-            self.allowed_channels = config_result[2]
+            # Set through the private attributes: the properties below rebuild
+            # the message filter, which is created further down
+            self._prefix: str = config_result[1]
+            self._prefix_len = len(self._prefix)
+            self._allowed_channels: frozenset[int] = frozenset(config_result[2])
             self.max_reconnect_attempts = config_result[3]
             self.reconnect_base_delay = config_result[4]
+            self.send_rate = config_result[5]
+            self.send_burst = config_result[6]
             logger.info(f"Configuration loaded from {config_path}")
             logger.info(f"Command prefix set to: '{self.prefix}'")
             if self.allowed_channels:
-                logger.info(f"Whitelisted channels: {self.allowed_channels}")
+                logger.info(f"Whitelisted channels: {sorted(self.allowed_channels)}")
         except FileNotFoundError:
             raise ConfigurationError(f"Config file not found at: {config_path}")
 
+        if event_loop_policy is not None:
+            self._install_loop_policy(event_loop_policy)
+
         # Internal state
         self.is_ready: bool = False
-        self.bot_user_id: int | None = None
-        self._ready_event = asyncio.Event()
-        self._incoming_queue: asyncio.Queue[SmartMessage] = asyncio.Queue()
+        self._bot_user_id: int | None = None
+        self._filter: Callable[[discord.Message], bool] = self._build_filter()
+        # Created lazily so it is bound to the loop the bot actually runs on
+        self._ready_future: asyncio.Future[None] | None = None
+        self._incoming_queue: asyncio.Queue[list[SmartMessage] | None] = asyncio.Queue()
+        self._batch: list[SmartMessage] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._smart_pool: deque[SmartMessage] = deque(maxlen=self.MESSAGE_POOL_SIZE)
+        self._send_buckets: dict[int, TokenBucket] = {}
         self._shutdown_event = asyncio.Event()
         self._client: BridgeClient | None = None
 
@@ -81,6 +184,24 @@ class Bridge:
         intents.message_content = True
         self._client = BridgeClient(self, intents=intents)
 
+    def _install_loop_policy(self, name: str) -> None:
+        """Install an event loop policy for loops created from now on.
+
+        Args:
+            name: The policy to install (see _install_event_loop_policy)
+        """
+        installed = _install_event_loop_policy(name)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            logger.info("Using '%s' event loop policy", installed)
+            return
+        logger.warning(
+            "Event loop policy '%s' installed while a loop is already running; "
+            "it will only apply to new event loops",
+            installed,
+        )
+
     async def run(self) -> None:
         """Start the bot and connect to Discord with automatic reconnection.
 
@@ -88,7 +209,7 @@ class Bridge:
         messages. It will block until the connection is closed.
 
         If the connection drops, it will automatically attempt to reconnect
-        with exponential backoff up to max_reconnect_attempts times.
+        up to max_reconnect_attempts times with a growing delay.
 
         Raises:
             ConnectionError: If initial login fails (invalid token)
@@ -103,26 +224,29 @@ class Bridge:
             raise ConnectionError("Failed to log in. Is the discord_token correct?")
 
     async def _connect_with_retry(self) -> None:
-        """Connect to Discord with automatic retry and exponential backoff.
+        """Connect to Discord with automatic retry paced by a token bucket.
 
         Attempts to connect to Discord, and if the connection drops,
-        automatically retries with exponential backoff.
+        automatically retries. The first RECONNECT_BURST retries happen
+        immediately; after that, the delay starts at reconnect_base_delay
+        and doubles on every attempt, capped at MAX_RECONNECT_DELAY.
         """
-        from .exceptions import ReconnectExhaustedError
-
         attempt = 0
+        bucket = TokenBucket(capacity=self.RECONNECT_BURST, rate=1.0 / self.reconnect_base_delay)
 
         while True:
             try:
                 if attempt > 0:
-                    delay = min(
-                        self.reconnect_base_delay * (2 ** (attempt - 1)),
-                        60.0,  # Cap at 60 seconds
-                    )
+                    delay = bucket.reserve()
+                    if attempt > self.RECONNECT_BURST:
+                        doublings = attempt - self.RECONNECT_BURST - 1
+                        backoff = self.reconnect_base_delay * 2**doublings
+                        delay = max(delay, min(backoff, self.MAX_RECONNECT_DELAY))
                     logger.info(
                         f"Reconnection attempt {attempt}/{self.max_reconnect_attempts} in {delay:.1f}s..."
                     )
-                    await asyncio.sleep(delay)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
 
                 logger.info("Connecting to Discord...")
                 await self._client.start(self.token)
@@ -138,12 +262,15 @@ class Bridge:
                 attempt += 1
 
                 if attempt >= self.max_reconnect_attempts:
-                    logger.error(f"Failed to reconnect after {attempt} attempts")
+                    logger.error(f"Failed to reconnect after {attempt} attempts", exc_info=e)
+                    # The traceback has been logged; drop it so the stored error
+                    # doesn't keep the failed connection's frames alive
+                    last_error = e.with_traceback(None)
                     raise ReconnectExhaustedError(
                         f"Failed to reconnect after {attempt} attempts: {e}",
                         attempts=attempt,
-                        last_error=e,
-                    ) from e
+                        last_error=last_error,
+                    ) from last_error
 
                 logger.warning(f"Connection lost: {e}. Will retry...")
 
@@ -152,9 +279,14 @@ class Bridge:
 
         This method will:
         1. Set the shutdown flag to stop accepting new messages
-        2. Wait for pending messages in the queue to be processed
+        2. Wait for pending messages in the queue to be handed to listen()
         3. Close the Discord client connection
 
+        The drain only guarantees that every queued message was handed to a
+        listen() consumer, not that the consumer finished processing it. If
+        messages are handled in other tasks, wait for those first so their
+        replies are sent before the connection closes.
+
         Example:
             >>> # In your application
             >>> try:
@@ -165,6 +297,7 @@ class Bridge:
         """
         logger.info("Initiating graceful shutdown...")
         self._shutdown_event.set()
+        self._flush_batch()
 
         # Wait for queue to drain (with timeout)
         logger.debug("Waiting for message queue to drain...")
@@ -173,7 +306,13 @@ class Bridge:
         except asyncio.TimeoutError:
             logger.warning("Queue drain timed out, forcing shutdown")
 
-        # Close Discord connection
+        # Sentinel: listen() exits once it has yielded everything queued before
+        # it. It is pushed after the drain so join() never waits on it when no
+        # listener is running.
+        self._incoming_queue.put_nowait(None)
+
+        # Close Discord connection. This closes the client's HTTP session, so
+        # replies still being sent for messages already handed out will fail.
         if self._client:
             logger.info("Closing Discord connection...")
             await self._client.close()
@@ -182,9 +321,31 @@ class Bridge:
         logger.info("Bridge shutdown complete")
 
     async def _drain_queue(self) -> None:
-        """Wait for the incoming message queue to be empty."""
-        while not self._incoming_queue.empty():
-            await asyncio.sleep(0.1)
+        """Wait until every queued batch has been taken off the queue by listen()."""
+        await self._incoming_queue.join()
+
+    async def acquire_send_token(self, channel_id: int) -> None:
+        """Wait until a message may be sent to a channel.
+
+        Each channel has its own token bucket allowing send_burst messages at
+        once, refilled at send_rate messages per second. SmartMessage replies
+        call this before every send so the bot throttles itself instead of
+        running into Discord's rate limits.
+
+        Args:
+            channel_id: The Discord ID of the channel to send to
+        """
+        bucket = self._send_buckets.get(channel_id)
+        if bucket is None:
+            bucket = TokenBucket(capacity=self.send_burst, rate=self.send_rate)
+            self._send_buckets[channel_id] = bucket
+        await bucket.acquire()
+
+    def _get_ready_future(self) -> asyncio.Future[None]:
+        """Return the one-shot ready future, creating it on the running loop."""
+        if self._ready_future is None:
+            self._ready_future = asyncio.get_running_loop().create_future()
+        return self._ready_future
 
     async def wait_for_ready(self) -> None:
         """Wait until the bot is connected and ready to receive messages.
@@ -193,7 +354,7 @@ class Bridge:
         Discord and is ready to process messages.
         """
         logger.debug("Waiting for bot to be ready...")
-        await self._ready_event.wait()
+        await self._get_ready_future()
         logger.info("Bot is ready!")
 
     async def listen(self) -> AsyncIterator[SmartMessage]:
@@ -210,27 +371,100 @@ class Bridge:
             ...     print(f"Received: {message.content}")
             ...     await message.reply("Got it!")
         """
-        while not self._shutdown_event.is_set():
-            try:
-                # Wait for message with timeout to check shutdown periodically
-                message = await asyncio.wait_for(self._incoming_queue.get(), timeout=1.0)
+        while True:
+            batch = await self._incoming_queue.get()
+            # Mark the batch as handed out right away: the consumer may call
+            # stop() from inside its loop body, and _drain_queue() must not
+            # wait on the batch that consumer is still iterating over
+            self._incoming_queue.task_done()
+            if batch is None:
+                # Shutdown sentinel pushed by stop()
+                break
+
+            for message in batch:
                 yield message
-            except asyncio.TimeoutError:
-                # Check shutdown flag and continue
-                continue
+                if self.recycle_messages:
+                    self._smart_pool.append(message)
+
+    @property
+    def bot_user_id(self) -> int | None:
+        """The Discord user ID of the bot (set after connection)."""
+        return self._bot_user_id
+
+    @bot_user_id.setter
+    def bot_user_id(self, value: int | None) -> None:
+        self._bot_user_id = value
+        # The message filter captures the bot ID, so rebuild it
+        self._filter = self._build_filter()
+
+    @property
+    def prefix(self) -> str:
+        """The command prefix messages must start with."""
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, value: str) -> None:
+        self._prefix = value
+        self._prefix_len = len(value)
+        self._filter = self._build_filter()
+
+    @property
+    def allowed_channels(self) -> frozenset[int]:
+        """IDs of the channels messages are accepted from (empty for all)."""
+        return self._allowed_channels
+
+    @allowed_channels.setter
+    def allowed_channels(self, value: Iterable[int]) -> None:
+        self._allowed_channels = frozenset(value)
+        self._filter = self._build_filter()
+
+    def _build_filter(self) -> Callable[[discord.Message], bool]:
+        """Build a message filter specialized for the current configuration.
+
+        The bot ID, prefix and channel whitelist are captured as closure locals
+        so the per-message checks avoid attribute lookups, and the whitelist
+        check is left out entirely when no channels are configured.
+
+        Returns:
+            A function returning True if the message should be queued
+        """
+        bot_user_id = self._bot_user_id
+        prefix = self._prefix
+        allowed_channels = self._allowed_channels
+
+        if not allowed_channels:
+
+            def accept(message: discord.Message) -> bool:
+                return message.author.id != bot_user_id and message.content.startswith(prefix)
+
+            return accept
+
+        def accept_whitelisted(message: discord.Message) -> bool:
+            if message.author.id == bot_user_id or not message.content.startswith(prefix):
+                return False
+            if message.channel.id not in allowed_channels:
+                logger.debug(
+                    "Ignoring message from non-whitelisted channel: %s", message.channel.id
+                )
+                return False
+            return True
+
+        return accept_whitelisted
 
     async def _handle_on_ready(self) -> None:
         """Handle the event when the bot successfully connects."""
         self.bot_user_id = self._client.user.id
         self.is_ready = True
-        self._ready_event.set()
-        logger.info(f"Bridge is ready. Logged in as {self._client.user}")
+        ready_future = self._get_ready_future()
+        if not ready_future.done():
+            ready_future.set_result(None)
+        logger.info("Bridge is ready. Logged in as %s", self._client.user)
 
     async def _handle_on_message(self, message: discord.Message) -> None:
         """Handle incoming Discord messages and filter them.
 
         This method filters messages based on:
-        1. Bot readiness state
+        1. Bot readiness and shutdown state
         2. Message author (ignores bot's own messages)
         3. Command prefix
         4. Channel whitelist (if configured)
@@ -238,23 +472,40 @@ class Bridge:
         Args:
             message: The raw Discord message object
         """
-        if not self.is_ready:
-            return
-
-        # 1. Ignore messages from the bot itself
-        if message.author.id == self.bot_user_id:
-            return
-
-        # 2. Ignore messages that don't start with the prefix
-        if not message.content.startswith(self.prefix):
+        if not self.is_ready or self._shutdown_event.is_set():
             return
 
-        # 3. Check channel whitelist if configured
-        if self.allowed_channels and message.channel.id not in self.allowed_channels:
-            logger.debug(f"Ignoring message from non-whitelisted channel: {message.channel.id}")
+        # Author, prefix and whitelist checks (see _build_filter)
+        if not self._filter(message):
             return
 
-        # If filters pass, create a SmartMessage and put it in the queue
-        smart_msg = SmartMessage(message, self.prefix)
-        logger.debug(f"Received command from {message.author.id}: {smart_msg.content}")
-        await self._incoming_queue.put(smart_msg)
+        # If filters pass, create a SmartMessage and add it to the pending batch
+        if self._smart_pool:
+            smart_msg = self._smart_pool.pop()
+            smart_msg.reinit(message, self._prefix, prefix_len=self._prefix_len)
+        else:
+            smart_msg = SmartMessage(
+                message,
+                self._prefix,
+                prefix_len=self._prefix_len,
+                send_limiter=self.acquire_send_token,
+            )
+        # Lazy %-formatting: nothing is formatted unless DEBUG is enabled
+        logger.debug("Received command from %s: %s", message.author.id, smart_msg.content)
+        self._batch.append(smart_msg)
+
+        if len(self._batch) >= self.BATCH_MAX_SIZE:
+            self._flush_batch()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.BATCH_LINGER, self._flush_batch)
+
+    def _flush_batch(self) -> None:
+        """Publish the pending batch of messages to the incoming queue."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._batch:
+            self._incoming_queue.put_nowait(self._batch)
+            self._batch = []
@@ -1,12 +1,24 @@
+import os
 from pathlib import Path
 from typing import List
 import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from .exceptions import ConfigurationError
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+ConfigTuple = tuple[str, str, List[int], int, float, float, int]
+
+# Validated configs keyed by path, stored with the file's mtime (ns) at load time
+_config_cache: dict[str, tuple[int, ConfigTuple]] = {}
+
 
 class BridgeConfig(BaseModel):
     """Pydantic model for Discord Bridge configuration.
@@ -19,7 +31,10 @@ class BridgeConfig(BaseModel):
         command_prefix: Prefix for bot commands (default: "!")
         allowed_channel_ids: List of whitelisted channel IDs (optional)
         max_reconnect_attempts: Max retry attempts on disconnect (default: 5)
-        reconnect_base_delay: Initial delay for exponential backoff in seconds (default: 1.0)
+        reconnect_base_delay: Seconds before the first reconnection attempt after the
+            immediate retries; doubles on each further attempt, up to 60s (default: 1.0)
+        send_rate: Outbound messages per second per channel (default: 1.0)
+        send_burst: Outbound messages sent to a channel at once (default: 5)
     """
 
     discord_token: str = Field(
@@ -39,13 +54,26 @@ class BridgeConfig(BaseModel):
     )
     reconnect_base_delay: float = Field(
         default=1.0,
-        description="Base delay in seconds for exponential backoff",
+        description="Initial reconnection delay in seconds, doubled on each further attempt",
         ge=0.1,
         le=60.0,
     )
+    send_rate: float = Field(
+        default=1.0,
+        description="Outbound messages per second allowed per channel",
+        gt=0.0,
+        le=50.0,
+    )
+    send_burst: int = Field(
+        default=5,
+        description="Outbound messages that may be sent to a channel at once",
+        ge=1,
+        le=50,
+    )
 
-    @validator("discord_token")
-    def token_not_placeholder(cls, v):
+    @field_validator("discord_token")
+    @classmethod
+    def token_not_placeholder(cls, v: str) -> str:
         """Ensure token is not the placeholder value."""
         if v == "YOUR_DISCORD_BOT_TOKEN_HERE":
             raise ValueError(
@@ -53,35 +81,58 @@ class BridgeConfig(BaseModel):
             )
         return v
 
-    @validator("allowed_channel_ids", pre=True)
-    def parse_channel_ids(cls, v):
+    @field_validator("allowed_channel_ids", mode="before")
+    @classmethod
+    def parse_channel_ids(cls, v: object) -> object:
         """Convert string channel IDs to integers."""
         if isinstance(v, list):
             return [int(x) for x in v]
         return v
 
 
-def load_config(path: Path) -> tuple[str, str, List[int], int, float]:
+def _copy_config(config_tuple: ConfigTuple) -> ConfigTuple:
+    """Copy the channel list so callers can't mutate a cached config."""
+    token, prefix, channels, max_retries, delay, rate, burst = config_tuple
+    return (token, prefix, list(channels), max_retries, delay, rate, burst)
+
+
+def load_config(path: Path) -> ConfigTuple:
     """Load and validate configuration from YAML file.
 
+    Results are cached per path and reused until the file's modification
+    time changes, so repeated loads skip YAML parsing and validation.
+
     Args:
         path: Path to the YAML configuration file
 
     Returns:
-        Tuple of (token, prefix, allowed_channels, max_reconnect_attempts, reconnect_base_delay)
+        Tuple of (token, prefix, allowed_channels, max_reconnect_attempts,
+        reconnect_base_delay, send_rate, send_burst)
 
     Raises:
         ConfigurationError: If config file is not found or invalid
 
     Example:
         >>> from pathlib import Path
-        >>> token, prefix, channels, max_retries, delay = load_config(Path("config.yaml"))
+        >>> token, prefix, channels, max_retries, delay, rate, burst = load_config(Path("config.yaml"))
     """
     logger.debug(f"Loading configuration from {path}")
 
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        logger.error(f"Configuration file not found: {path}")
+        raise ConfigurationError(f"Config file not found at: {path}")
+
+    cache_key = str(path)
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        logger.debug("Using cached configuration for %s", path)
+        return _copy_config(cached[1])
+
     try:
         with open(path, "r") as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=_Loader)
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {path}")
         raise ConfigurationError(f"Config file not found at: {path}")
@@ -96,13 +147,18 @@ def load_config(path: Path) -> tuple[str, str, List[int], int, float]:
     try:
         config = BridgeConfig(**raw_config)
         logger.info("Configuration validated successfully")
-        return (
-            config.discord_token,
-            config.command_prefix,
-            config.allowed_channel_ids,
-            config.max_reconnect_attempts,
-            config.reconnect_base_delay,
-        )
     except ValueError as e:
         logger.error(f"Configuration validation failed: {e}")
         raise ConfigurationError(f"Invalid configuration: {e}")
+
+    config_tuple: ConfigTuple = (
+        config.discord_token,
+        config.command_prefix,
+        config.allowed_channel_ids,
+        config.max_reconnect_attempts,
+        config.reconnect_base_delay,
+        config.send_rate,
+        config.send_burst,
+    )
+    _config_cache[cache_key] = (mtime_ns, config_tuple)
+    return _copy_config(config_tuple)
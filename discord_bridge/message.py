@@ -1,11 +1,39 @@
 import asyncio
 import discord
+import io
+import os
+import random
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 from .exceptions import MessageSendError
 from .logger import get_logger
+from .ratelimit import TokenBucket
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class _QueuedChunk:
+    """One chunk of reply text waiting in a channel writer's queue.
+
+    The channel and send limiter are captured when the chunk is queued, so a
+    recycled SmartMessage can be reinitialized while the chunk is pending.
+
+    Attributes:
+        channel: The channel to send the text to
+        send_limiter: The replying SmartMessage's send limiter, if any
+        text: The chunk's text
+        future: Result of the whole reply, shared by all of its chunks
+        last: Whether this is the reply's final chunk
+    """
+
+    channel: discord.abc.Messageable
+    send_limiter: Callable[[int], Awaitable[None]] | None
+    text: str
+    future: asyncio.Future[None]
+    last: bool
+
+
 class SmartMessage:
     """A wrapper around Discord messages with convenient reply functionality.
 
@@ -26,45 +54,224 @@ class SmartMessage:
         ...     await message.reply("Thanks for your message!")
     """
 
-    # Discord rate limit: ~5 messages per 5 seconds per channel
-    # We use 1.2 second delay to be safe
-    CHUNK_DELAY: float = 1.2
+    # Discord rate limit: ~5 messages per 5 seconds per channel. Used for
+    # messages without a send_limiter (the Bridge supplies its own)
+    CHANNEL_BURST: int = 5
+    CHANNEL_RATE: float = 1.0
     MAX_MESSAGE_LENGTH: int = 2000
-
-    def __init__(self, original_message: discord.Message, prefix: str) -> None:
+    # How far back from the limit to look for a newline/space to split at
+    SPLIT_LOOKBACK: int = 200
+    # Discord embed limits used by reply_long
+    EMBED_DESCRIPTION_LIMIT: int = 4096
+    EMBED_FIELD_LIMIT: int = 1024
+    EMBED_MAX_FIELDS: int = 25
+    EMBED_TOTAL_LIMIT: int = 6000
+    # discord.py already retries ordinary 429s itself; one that still reaches
+    # us (e.g. a Cloudflare ban) is retried after the response's Retry-After
+    # header plus up to RETRY_JITTER
+    SEND_ATTEMPTS: int = 3
+    RETRY_JITTER: float = 0.5
+    # Seconds a channel writer waits for new replies before shutting down
+    WRITER_IDLE_TIMEOUT: float = 60.0
+
+    # Shared by all SmartMessages so replies to the same channel share a budget
+    _channel_buckets: dict[int, TokenBucket] = {}
+    # One writer task per channel sends queued reply() text, joining replies
+    # that are waiting at the same time into fewer messages
+    _channel_writers: dict[int, asyncio.Queue[_QueuedChunk]] = {}
+    _writer_tasks: dict[int, asyncio.Task] = {}
+
+    # Only the channel is kept, so queued messages don't pin the whole
+    # discord.Message (attachments, embeds, mentions) in memory
+    __slots__ = (
+        "_channel",
+        "_send_limiter",
+        "content",
+        "author_id",
+        "author_name",
+        "channel_id",
+        "is_dm",
+    )
+
+    def __init__(
+        self,
+        original_message: discord.Message,
+        prefix: str,
+        prefix_len: int | None = None,
+        send_limiter: Callable[[int], Awaitable[None]] | None = None,
+    ) -> None:
         """Initialize SmartMessage from a Discord message.
 
         Args:
             original_message: The raw Discord message object
             prefix: The command prefix to strip from content
+            prefix_len: Precomputed len(prefix). Only pass this when the content
+                is already known to start with the prefix; it is sliced off
+                without being checked again.
+            send_limiter: Optional coroutine function awaited with the channel
+                ID before every send (e.g. Bridge.acquire_send_token)
         """
-        self._original: discord.Message = original_message
-        self.content: str = original_message.content.removeprefix(prefix).strip()
-        self.author_id: int = original_message.author.id
-        self.author_name: str = (
-            original_message.author.display_name
-            if hasattr(original_message.author, "display_name")
-            else str(original_message.author)
-        )
-        self.channel_id: int = original_message.channel.id
-        self.is_dm: bool = isinstance(original_message.channel, discord.DMChannel)
+        self._send_limiter = send_limiter
+        self.reinit(original_message, prefix, prefix_len)
+
+    def reinit(
+        self,
+        original_message: discord.Message,
+        prefix: str,
+        prefix_len: int | None = None,
+    ) -> None:
+        """Reset this SmartMessage to wrap a different Discord message.
+
+        Used by the Bridge to recycle SmartMessage objects instead of allocating
+        a new one per message. Takes the same arguments as the constructor.
+        """
+        channel = original_message.channel
+        self._channel: discord.abc.Messageable = channel
+        if prefix_len is None:
+            self.content: str = original_message.content.removeprefix(prefix).strip()
+        else:
+            self.content = original_message.content[prefix_len:].strip()
+        author = original_message.author
+        self.author_id: int = author.id
+        self.author_name: str = getattr(author, "display_name", None) or str(author)
+        self.channel_id: int = channel.id
+        self.is_dm: bool = isinstance(channel, discord.DMChannel)
 
         logger.debug(
-            f"SmartMessage created: author={self.author_name}, "
-            f"content='{self.content[:50]}...', is_dm={self.is_dm}"
+            "SmartMessage initialized: author=%s, content='%.50s...', is_dm=%s",
+            self.author_name,
+            self.content,
+            self.is_dm,
         )
 
+    @classmethod
+    async def _wait_for_send_slot(
+        cls, channel_id: int, send_limiter: Callable[[int], Awaitable[None]] | None
+    ) -> None:
+        """Wait until the channel's rate limit allows another message.
+
+        Uses the send_limiter if one was given, otherwise a class-level token
+        bucket per channel. Returns immediately while burst capacity is left.
+
+        Args:
+            channel_id: The channel about to be sent to
+            send_limiter: The sending SmartMessage's send limiter, if any
+        """
+        if send_limiter is not None:
+            await send_limiter(channel_id)
+            return
+
+        bucket = cls._channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = TokenBucket(capacity=cls.CHANNEL_BURST, rate=cls.CHANNEL_RATE)
+            cls._channel_buckets[channel_id] = bucket
+        await bucket.acquire()
+
+    @staticmethod
+    def _retry_after(error: discord.HTTPException, default: float = 1.0) -> float:
+        """Read the Retry-After header of a 429 response.
+
+        Args:
+            error: The HTTPException raised by the failed send
+            default: Delay to use if the header is missing or malformed
+
+        Returns:
+            The number of seconds to wait before retrying
+        """
+        headers = getattr(error.response, "headers", None) or {}
+        try:
+            return float(headers.get("Retry-After", default))
+        except (TypeError, ValueError):
+            return default
+
+    async def _send(
+        self,
+        *args: Any,
+        file_factory: Callable[[], Awaitable[discord.File]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Send to this message's channel, retrying when Discord answers with a 429.
+
+        Args:
+            *args: Positional arguments for channel.send
+            file_factory: Coroutine function building the file to attach.
+                Called once per attempt because discord.py closes files after
+                a send.
+            **kwargs: Keyword arguments for channel.send
+        """
+        await self._send_to(
+            self._channel,
+            self.channel_id,
+            self._send_limiter,
+            *args,
+            file_factory=file_factory,
+            **kwargs,
+        )
+
+    @classmethod
+    async def _send_to(
+        cls,
+        channel: discord.abc.Messageable,
+        channel_id: int,
+        send_limiter: Callable[[int], Awaitable[None]] | None,
+        *args: Any,
+        file_factory: Callable[[], Awaitable[discord.File]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Send to a channel, retrying when Discord answers with a 429.
+
+        Each attempt waits for a send slot first. Rate limited attempts sleep
+        for the server's Retry-After (plus jitter) before trying again; other
+        errors, and the last 429, are raised to the caller.
+
+        Args:
+            channel: The channel to send to
+            channel_id: The channel's ID, used for rate limiting
+            send_limiter: Send limiter to wait on, or None for the class buckets
+            *args: Positional arguments for channel.send
+            file_factory: Coroutine function building the file to attach.
+                Called once per attempt because discord.py closes files after
+                a send.
+            **kwargs: Keyword arguments for channel.send
+        """
+        for attempt in range(1, cls.SEND_ATTEMPTS + 1):
+            if file_factory is not None:
+                kwargs["file"] = await file_factory()
+            await cls._wait_for_send_slot(channel_id, send_limiter)
+            try:
+                await channel.send(*args, **kwargs)
+                return
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == cls.SEND_ATTEMPTS:
+                    raise
+                delay = cls._retry_after(e) + random.uniform(0, cls.RETRY_JITTER)
+                logger.warning(
+                    "Rate limited in channel %s, retrying in %.2fs (attempt %d/%d)",
+                    channel_id,
+                    delay,
+                    attempt,
+                    cls.SEND_ATTEMPTS,
+                )
+                await asyncio.sleep(delay)
+
     async def reply(self, text: str) -> None:
         """Send a reply to the channel where the message was received.
 
-        Automatically splits messages longer than 2000 characters and
-        adds delays between chunks to respect Discord's rate limits.
+        Automatically splits messages longer than 2000 characters, preferring
+        to cut at a newline or space, and paces sends with a per-channel
+        token bucket to respect Discord's rate limits. Sends that hit a 429
+        are retried after the server's Retry-After.
+
+        Text is sent by a writer task shared by all replies to the channel.
+        Short replies that are waiting at the same time (e.g. from concurrent
+        commands) are joined with newlines and sent as one message.
 
         Args:
             text: The text to send as a reply
 
         Raises:
-            MessageSendError: If the message fails to send
+            MessageSendError: If the message fails to send (including after
+                SEND_ATTEMPTS rate limited attempts)
 
         Example:
             >>> await message.reply("This is my response!")
@@ -73,26 +280,17 @@ class SmartMessage:
         """
         try:
             if len(text) <= self.MAX_MESSAGE_LENGTH:
-                logger.debug(f"Sending single message ({len(text)} chars)")
-                await self._original.channel.send(text)
+                logger.debug("Queueing single message (%d chars)", len(text))
+                chunks = [text]
             else:
-                # Split the message into chunks and send with delays
+                # Split the message into chunks; the token bucket spaces them out
                 chunks = self._split_message(text)
                 logger.info(
                     f"Message too long ({len(text)} chars), "
                     f"splitting into {len(chunks)} chunks"
                 )
 
-                for i, chunk in enumerate(chunks):
-                    await self._original.channel.send(chunk)
-                    logger.debug(
-                        f"Sent chunk {i + 1}/{len(chunks)} ({len(chunk)} chars)"
-                    )
-
-                    # Add delay between chunks to respect rate limits
-                    if i < len(chunks) - 1:
-                        logger.debug(f"Waiting {self.CHUNK_DELAY}s before next chunk")
-                        await asyncio.sleep(self.CHUNK_DELAY)
+            await self._enqueue(chunks)
 
         except discord.HTTPException as e:
             logger.error(f"Failed to send message: {e.status} {e.text}")
@@ -103,19 +301,167 @@ class SmartMessage:
             logger.error(f"Unexpected error sending message: {e}")
             raise MessageSendError(f"Failed to send message: {e}") from e
 
-    def _split_message(self, text: str) -> list[str]:
+    async def _enqueue(self, chunks: list[str]) -> None:
+        """Queue chunks on this channel's writer and wait until all are sent.
+
+        Chunks are queued together, so they stay in order and are never
+        interleaved with another reply's text. If one chunk fails to send,
+        the rest of the reply is dropped.
+
+        Raises:
+            Exception: Whatever the send of the failed chunk raised
+        """
+        loop = asyncio.get_running_loop()
+        task = self._writer_tasks.get(self.channel_id)
+        if task is None or task.done() or task.get_loop() is not loop:
+            queue: asyncio.Queue[_QueuedChunk] = asyncio.Queue()
+            self._channel_writers[self.channel_id] = queue
+            self._writer_tasks[self.channel_id] = loop.create_task(
+                self._run_channel_writer(self.channel_id, queue)
+            )
+        queue = self._channel_writers[self.channel_id]
+
+        future: asyncio.Future[None] = loop.create_future()
+        last = len(chunks) - 1
+        for i, chunk in enumerate(chunks):
+            queue.put_nowait(
+                _QueuedChunk(self._channel, self._send_limiter, chunk, future, i == last)
+            )
+        await future
+
+    @classmethod
+    async def _run_channel_writer(cls, channel_id: int, queue: asyncio.Queue[_QueuedChunk]) -> None:
+        """Send queued reply text for one channel.
+
+        Replies that are already waiting when a send starts are joined with
+        newlines, up to MAX_MESSAGE_LENGTH, and sent as one message. A lone
+        reply is sent unchanged. Chunks of replies that have already failed
+        or been cancelled are skipped. Exits after WRITER_IDLE_TIMEOUT seconds
+        with nothing to send.
+
+        Args:
+            channel_id: The channel this writer sends to
+            queue: Queue of chunks to send
+        """
+        carry: _QueuedChunk | None = None
+        while True:
+            if carry is None:
+                try:
+                    carry = await asyncio.wait_for(queue.get(), cls.WRITER_IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    if not queue.empty():
+                        continue
+                    if cls._channel_writers.get(channel_id) is queue:
+                        del cls._channel_writers[channel_id]
+                        del cls._writer_tasks[channel_id]
+                    return
+
+            first = carry
+            carry = None
+            # The reply failed, was cancelled or timed out while this was queued
+            if first.future.done():
+                continue
+            group = [first]
+            text = first.text
+            while not queue.empty():
+                chunk = queue.get_nowait()
+                if chunk.future.done():
+                    continue
+                if len(text) + 1 + len(chunk.text) > cls.MAX_MESSAGE_LENGTH:
+                    carry = chunk
+                    break
+                text += "\n" + chunk.text
+                group.append(chunk)
+
+            try:
+                await cls._send_to(first.channel, channel_id, first.send_limiter, text)
+            except asyncio.CancelledError:
+                for chunk in group:
+                    chunk.future.cancel()
+                raise
+            except Exception as e:
+                # Failing the shared future drops the rest of each reply
+                for chunk in group:
+                    if not chunk.future.done():
+                        chunk.future.set_exception(e)
+            else:
+                logger.debug("Sent %d chars (%d chunks)", len(text), len(group))
+                for chunk in group:
+                    if chunk.last and not chunk.future.done():
+                        chunk.future.set_result(None)
+
+    async def reply_long(self, text: str, color: int = 0x3498DB) -> None:
+        """Send long text using as few messages as possible.
+
+        Text that fits in a normal message is sent as-is. Longer text is packed
+        into a single embed (up to 4096 characters of description plus
+        1024-character fields, within Discord's 6000 character embed limit).
+        Only text too long for one embed falls back to reply()'s chunked sends.
+
+        Args:
+            text: The text to send
+            color: Embed color used when the text is packed into an embed
+
+        Raises:
+            MessageSendError: If the message fails to send
+
+        Example:
+            >>> await message.reply_long(help_text)  # One API call for ~6000 chars
+        """
+        if len(text) <= self.MAX_MESSAGE_LENGTH or len(text) > self.EMBED_TOTAL_LIMIT:
+            await self.reply(text)
+            return
+
+        description = self._split_message(text, self.EMBED_DESCRIPTION_LIMIT)[0]
+        rest = text[len(description) :].lstrip()
+        values = self._split_message(rest, self.EMBED_FIELD_LIMIT) if rest else []
+
+        # Each field needs a name; a zero-width space counts as one character
+        total = len(description) + sum(len(value) + 1 for value in values)
+        if total > self.EMBED_TOTAL_LIMIT or len(values) > self.EMBED_MAX_FIELDS:
+            await self.reply(text)
+            return
+
+        await self.reply_with_embed(
+            description=description,
+            color=color,
+            fields=[{"name": "\u200b", "value": value} for value in values],
+        )
+
+    def _split_message(self, text: str, limit: int | None = None) -> list[str]:
         """Split text into chunks that fit Discord's message limit.
 
+        Each chunk is cut at the last newline (or failing that, space) within
+        SPLIT_LOOKBACK characters of the limit, dropping that separator. Text
+        with no such boundary is cut at exactly the limit.
+
         Args:
             text: The text to split
+            limit: Maximum chunk length (default: MAX_MESSAGE_LENGTH)
 
         Returns:
             List of message chunks
         """
+        if limit is None:
+            limit = self.MAX_MESSAGE_LENGTH
         chunks = []
-        for i in range(0, len(text), self.MAX_MESSAGE_LENGTH):
-            chunk = text[i : i + self.MAX_MESSAGE_LENGTH]
-            chunks.append(chunk)
+        start = 0
+
+        while len(text) - start > limit:
+            end = start + limit
+            window_start = max(start, end - self.SPLIT_LOOKBACK)
+            cut = text.rfind("\n", window_start, end)
+            if cut == -1:
+                cut = text.rfind(" ", window_start, end)
+
+            if cut > start:
+                chunks.append(text[start:cut])
+                start = cut + 1  # Skip the separator
+            else:
+                chunks.append(text[start:end])
+                start = end
+
+        chunks.append(text[start:])
         return chunks
 
     async def reply_with_file(
@@ -123,35 +469,59 @@ class SmartMessage:
         content: str | None = None,
         file_path: str | None = None,
         filename: str | None = None,
+        fp: io.BufferedIOBase | None = None,
     ) -> None:
         """Send a reply with an attached file.
 
+        The file can be given as a path on disk or as an in-memory binary file
+        object (e.g. io.BytesIO), which avoids writing temporary files.
+
         Args:
             content: Optional text content to include with the file
             file_path: Path to the file to upload
-            filename: Optional custom filename (uses basename if not provided)
+            filename: Optional custom filename (uses basename if not provided).
+                Set this when passing fp, which usually has no name.
+            fp: Binary file object to upload instead of file_path. It is read
+                from its current position and is not closed.
 
         Raises:
             MessageSendError: If the file fails to send
             FileNotFoundError: If the file doesn't exist
+            ValueError: If neither file_path nor fp is given
 
         Example:
             >>> await message.reply_with_file(
             ...     content="Here's your file!",
             ...     file_path="/path/to/document.pdf"
             ... )
+            >>> await message.reply_with_file(
+            ...     fp=io.BytesIO(b"hello"), filename="hello.txt"
+            ... )
         """
         try:
-            from pathlib import Path
+            if fp is not None:
+                start = fp.tell()
 
-            if file_path and not Path(file_path).exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
+                async def file_factory() -> discord.File:
+                    # Rewind so a retried send uploads the whole file again
+                    fp.seek(start)
+                    return discord.File(fp, filename=filename)
+
+            elif file_path is not None:
+                if not os.path.isfile(file_path):
+                    raise FileNotFoundError(f"File not found: {file_path}")
+
+                async def file_factory() -> discord.File:
+                    # Opening the file is blocking I/O, so keep it off the event loop
+                    return await asyncio.to_thread(discord.File, file_path, filename=filename)
+
+            else:
+                raise ValueError("Either file_path or fp must be given")
 
-            file = discord.File(file_path, filename=filename)
-            await self._original.channel.send(content=content, file=file)
-            logger.debug(f"Sent file reply: {filename or file_path}")
+            await self._send(content=content, file_factory=file_factory)
+            logger.debug("Sent file reply: %s", filename or file_path)
 
-        except FileNotFoundError:
+        except (FileNotFoundError, ValueError):
             raise
         except discord.HTTPException as e:
             logger.error(f"Failed to send file: {e.status} {e.text}")
@@ -216,8 +586,8 @@ class SmartMessage:
             if thumbnail_url:
                 embed.set_thumbnail(url=thumbnail_url)
 
-            await self._original.channel.send(embed=embed)
-            logger.debug(f"Sent embed reply: title='{title}'")
+            await self._send(embed=embed)
+            logger.debug("Sent embed reply: title='%s'", title)
 
         except discord.HTTPException as e:
             logger.error(f"Failed to send embed: {e.status} {e.text}")
@@ -1,5 +1,8 @@
 """Middleware system for extending Discord Bridge functionality."""
 
+import functools
+import time
+from collections import OrderedDict
 from typing import Callable, Awaitable, List
 from dataclasses import dataclass
 
@@ -8,13 +11,16 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Sentinel for dict.pop, since a stored middleware maps to None
+_MISSING = object()
+
 # Type alias for middleware functions
 MiddlewareFunction = Callable[
     [SmartMessage, Callable[[SmartMessage], Awaitable[None]]], Awaitable[None]
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class MiddlewareContext:
     """Context object passed through middleware chain.
 
@@ -65,14 +71,29 @@ class MiddlewareManager:
         ...     await manager.execute(message, router.handle)
     """
 
+    # Compiled chains kept for the most recently used handlers. Callers
+    # passing a fresh lambda or partial per message would otherwise grow
+    # the cache without bound.
+    COMPILED_CACHE_SIZE: int = 8
+
     def __init__(self) -> None:
         """Initialize the middleware manager."""
-        self._middlewares: List[MiddlewareFunction] = []
+        # Insertion-ordered; used as an ordered set for O(1) remove
+        self._middlewares: dict[MiddlewareFunction, None] = {}
+        # LRU of compiled chains per handler passed to execute(); wiped whenever
+        # the middleware list changes. Bound methods (e.g. router.handle) hash
+        # and compare equal across accesses, so they share one entry.
+        self._compiled: OrderedDict[Callable, Callable[[MiddlewareContext], Awaitable[None]]] = (
+            OrderedDict()
+        )
         logger.debug("MiddlewareManager initialized")
 
     def use(self, middleware: MiddlewareFunction) -> MiddlewareFunction:
         """Decorator to register a middleware function.
 
+        Middleware runs in registration order. Registering the same function
+        again has no effect.
+
         Args:
             middleware: Async function with signature:
                 async def middleware(ctx: MiddlewareContext, next: Callable) -> None
@@ -89,8 +110,9 @@ class MiddlewareManager:
             ...     # After command handling
             ...     print("After")
         """
-        self._middlewares.append(middleware)
-        logger.debug(f"Registered middleware: {middleware.__name__}")
+        self._middlewares[middleware] = None
+        self._compiled.clear()
+        logger.debug("Registered middleware: %s", getattr(middleware, "__name__", middleware))
         return middleware
 
     def remove(self, middleware: MiddlewareFunction) -> bool:
@@ -102,15 +124,16 @@ class MiddlewareManager:
         Returns:
             True if removed, False if not found
         """
-        if middleware in self._middlewares:
-            self._middlewares.remove(middleware)
-            logger.debug(f"Removed middleware: {middleware.__name__}")
+        if self._middlewares.pop(middleware, _MISSING) is not _MISSING:
+            self._compiled.clear()
+            logger.debug("Removed middleware: %s", getattr(middleware, "__name__", middleware))
             return True
         return False
 
     def clear(self) -> None:
         """Remove all middleware from the chain."""
         self._middlewares.clear()
+        self._compiled.clear()
         logger.debug("All middleware cleared")
 
     async def execute(
@@ -125,30 +148,67 @@ class MiddlewareManager:
         Returns:
             True if message was handled, False if cancelled
         """
+        # Nothing can cancel the message without middleware
+        if not self._middlewares:
+            await handler(message)
+            return True
+
+        chain = self._compiled.get(handler)
+        if chain is None:
+            chain = self._compiled[handler] = self._compile(handler)
+            if len(self._compiled) > self.COMPILED_CACHE_SIZE:
+                self._compiled.popitem(last=False)
+        else:
+            self._compiled.move_to_end(handler)
+
         ctx = MiddlewareContext(message=message)
+        await chain(ctx)
+        return not ctx.cancelled
 
-        # Build the execution chain
-        async def execute_chain(index: int) -> None:
-            if ctx.cancelled:
-                logger.debug("Message processing cancelled by middleware")
-                return
+    def _compile(
+        self, handler: Callable[[SmartMessage], Awaitable[None]]
+    ) -> Callable[[MiddlewareContext], Awaitable[None]]:
+        """Fold the middleware list and final handler into a single callable.
 
-            if index < len(self._middlewares):
-                # Execute next middleware
-                middleware = self._middlewares[index]
-                logger.debug(f"Executing middleware: {middleware.__name__}")
+        The chain is built once, right to left, so each message only pays for
+        one call per middleware instead of rebuilding nested closures.
 
-                async def next_middleware():
-                    await execute_chain(index + 1)
+        Args:
+            handler: The final handler to execute
 
-                await middleware(ctx, next_middleware)
-            else:
-                # Execute final handler
-                logger.debug("Executing final handler")
-                await handler(message)
+        Returns:
+            Async function taking a MiddlewareContext and running the chain
+        """
+        chain = functools.partial(_run_handler, handler)
+        for middleware in reversed(self._middlewares):
+            chain = functools.partial(_run_middleware, middleware, chain)
+        return chain
 
-        await execute_chain(0)
-        return not ctx.cancelled
+
+async def _run_middleware(
+    middleware: MiddlewareFunction,
+    next_link: Callable[[MiddlewareContext], Awaitable[None]],
+    ctx: MiddlewareContext,
+) -> None:
+    """Run one middleware, giving it a next() that continues the chain."""
+    if ctx.cancelled:
+        logger.debug("Message processing cancelled by middleware")
+        return
+
+    logger.debug("Executing middleware: %s", getattr(middleware, "__name__", middleware))
+    await middleware(ctx, lambda: next_link(ctx))
+
+
+async def _run_handler(
+    handler: Callable[[SmartMessage], Awaitable[None]], ctx: MiddlewareContext
+) -> None:
+    """Run the final handler at the end of the chain."""
+    if ctx.cancelled:
+        logger.debug("Message processing cancelled by middleware")
+        return
+
+    logger.debug("Executing final handler")
+    await handler(ctx.message)
 
 
 # Built-in middleware examples
@@ -176,7 +236,9 @@ async def rate_limit_middleware(
 ) -> None:
     """Built-in middleware for rate limiting.
 
-    Limits each user to a certain number of requests per time window.
+    Limits each user to a certain number of requests per time window using
+    a token bucket: each user can burst up to max_requests commands, and
+    tokens refill continuously at max_requests per window_seconds.
 
     Args:
         ctx: Middleware context
@@ -190,26 +252,26 @@ async def rate_limit_middleware(
         >>> from functools import partial
         >>> manager.use(partial(rate_limit_middleware, max_requests=3, window_seconds=10))
     """
-    import time
-    from collections import defaultdict
-
-    # This would normally be stored in a persistent way
-    # For demo purposes, using a simple dict (resets on restart)
-    if not hasattr(rate_limit_middleware, "_user_requests"):
-        rate_limit_middleware._user_requests = defaultdict(list)
+    # Per-user token buckets stored as [tokens, last_refill] (a list so it can
+    # be updated in place). This would normally be stored in a persistent way;
+    # for demo purposes, using a simple dict (resets on restart)
+    if not hasattr(rate_limit_middleware, "_buckets"):
+        rate_limit_middleware._buckets = {}
 
     user_id = ctx.message.author_id
-    current_time = time.time()
+    now = time.monotonic()
 
-    # Clean old requests
-    rate_limit_middleware._user_requests[user_id] = [
-        req_time
-        for req_time in rate_limit_middleware._user_requests[user_id]
-        if current_time - req_time < window_seconds
-    ]
+    state = rate_limit_middleware._buckets.get(user_id)
+    if state is None:
+        state = [float(max_requests), now]
+        rate_limit_middleware._buckets[user_id] = state
+    else:
+        # Refill at max_requests tokens per window, capped at max_requests
+        state[0] = min(max_requests, state[0] + (now - state[1]) * max_requests / window_seconds)
+        state[1] = now
 
     # Check rate limit
-    if len(rate_limit_middleware._user_requests[user_id]) >= max_requests:
+    if state[0] < 1.0:
         logger.warning(f"Rate limit exceeded for user {user_id}")
         await ctx.message.reply(
             f"You're sending commands too fast! Please wait {window_seconds} seconds."
@@ -217,8 +279,8 @@ async def rate_limit_middleware(
         ctx.cancelled = True
         return
 
-    # Record this request
-    rate_limit_middleware._user_requests[user_id].append(current_time)
+    # Consume a token for this request
+    state[0] -= 1.0
 
     await next()
 
@@ -231,7 +293,7 @@ async def dm_only_middleware(ctx: MiddlewareContext, next: Callable) -> None:
         >>> manager.use(dm_only_middleware)
     """
     if not ctx.message.is_dm:
-        logger.debug(f"Ignoring non-DM message from {ctx.message.author_name}")
+        logger.debug("Ignoring non-DM message from %s", ctx.message.author_name)
         await ctx.message.reply("This command only works in direct messages!")
         ctx.cancelled = True
         return
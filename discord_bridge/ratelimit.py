@@ -0,0 +1,47 @@
+"""Token bucket rate limiting used for reconnects and outbound messages."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket that allows bursts up to capacity, refilling at rate.
+
+    Reservations may borrow tokens the bucket does not have yet, so
+    concurrent callers are spaced 1/rate seconds apart in reservation order.
+
+    Attributes:
+        capacity: Maximum number of tokens (burst size)
+        rate: Tokens added back per second
+
+    Example:
+        >>> bucket = TokenBucket(capacity=5, rate=1.0)
+        >>> await bucket.acquire()  # Returns immediately while tokens are left
+    """
+
+    capacity: int
+    rate: float
+    tokens: float = field(init=False)
+    last_refill: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+
+    def reserve(self) -> float:
+        """Consume a token and return how long to wait until it is available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1.0
+        if self.tokens >= 0.0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Consume a token, sleeping until it is available if needed."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -1,5 +1,6 @@
 """Command router for Discord Bridge with decorator-based registration."""
 
+import bisect
 from typing import Callable, Awaitable, Optional
 from dataclasses import dataclass
 
@@ -9,7 +10,7 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandInfo:
     """Information about a registered command.
 
@@ -51,9 +52,11 @@ class CommandRouter:
     def __init__(self) -> None:
         """Initialize the command router."""
         self._commands: dict[str, CommandInfo] = {}
-        self._default_handler: Optional[
-            Callable[[SmartMessage, str], Awaitable[None]]
-        ] = None
+        # Same commands kept sorted by name as they are registered, for help
+        self._sorted_commands: list[tuple[str, CommandInfo]] = []
+        self._default_handler: Optional[Callable[[SmartMessage, str], Awaitable[None]]] = None
+        # Rendered help text, rebuilt lazily after a command is registered
+        self._help_cache: str | None = None
         logger.debug("CommandRouter initialized")
 
     def command(self, name: str, description: str = "", usage: str = "") -> Callable:
@@ -76,10 +79,17 @@ class CommandRouter:
         def decorator(
             handler: Callable[[SmartMessage, str], Awaitable[None]],
         ) -> Callable[[SmartMessage, str], Awaitable[None]]:
-            self._commands[name.lower()] = CommandInfo(
-                name=name.lower(), handler=handler, description=description, usage=usage
-            )
-            logger.debug(f"Registered command: {name}")
+            key = name.lower()
+            cmd_info = CommandInfo(name=key, handler=handler, description=description, usage=usage)
+            self._commands[key] = cmd_info
+
+            i = bisect.bisect_left(self._sorted_commands, key, key=lambda item: item[0])
+            if i < len(self._sorted_commands) and self._sorted_commands[i][0] == key:
+                self._sorted_commands[i] = (key, cmd_info)
+            else:
+                self._sorted_commands.insert(i, (key, cmd_info))
+            self._help_cache = None
+            logger.debug("Registered command: %s", name)
             return handler
 
         return decorator
@@ -113,12 +123,17 @@ class CommandRouter:
             ...     if not handled:
             ...         logger.info(f"Unhandled message: {message.content}")
         """
-        # Parse command and arguments
-        parts = message.content.split(maxsplit=1)
-        command = parts[0].lower() if parts else ""
-        args = parts[1] if len(parts) > 1 else ""
-
-        logger.debug(f"Handling command: {command} with args: {args[:50]}...")
+        # Parse command and arguments. Content is already stripped, so the
+        # common case is "<command> <args>" separated by a single space
+        command, _, args = message.content.partition(" ")
+        if "\n" in command or "\t" in command:
+            parts = message.content.split(maxsplit=1)
+            command = parts[0]
+            args = parts[1] if len(parts) > 1 else ""
+        command = command.lower()
+        args = args.lstrip()
+
+        logger.debug("Handling command: %s with args: %.50s...", command, args)
 
         # Check for built-in help command
         if command == "help":
@@ -126,11 +141,11 @@ class CommandRouter:
             return True
 
         # Find and execute command handler
-        if command in self._commands:
-            cmd_info = self._commands[command]
+        cmd_info = self._commands.get(command)
+        if cmd_info is not None:
             try:
                 await cmd_info.handler(message, args)
-                logger.debug(f"Command '{command}' handled successfully")
+                logger.debug("Command '%s' handled successfully", command)
                 return True
             except Exception as e:
                 logger.error(f"Error handling command '{command}': {e}")
@@ -147,7 +162,7 @@ class CommandRouter:
                 logger.error(f"Error in default handler: {e}")
                 return False
 
-        logger.debug(f"No handler found for command: {command}")
+        logger.debug("No handler found for command: %s", command)
         return False
 
     async def _handle_help(self, message: SmartMessage) -> None:
@@ -156,18 +171,21 @@ class CommandRouter:
         Args:
             message: The message requesting help
         """
-        help_lines = ["**Available Commands:**\n"]
-
-        for cmd_name, cmd_info in sorted(self._commands.items()):
-            line = f"`!{cmd_name}`"
-            if cmd_info.description:
-                line += f" - {cmd_info.description}"
-            if cmd_info.usage:
-                line += f"\n  Usage: `!{cmd_name} {cmd_info.usage}`"
-            help_lines.append(line)
-
-        help_text = "\n".join(help_lines)
-        await message.reply(help_text)
+        if self._help_cache is None:
+            help_lines = ["**Available Commands:**\n"]
+
+            for cmd_name, cmd_info in self._sorted_commands:
+                line = f"`!{cmd_name}`"
+                if cmd_info.description:
+                    line += f" - {cmd_info.description}"
+                if cmd_info.usage:
+                    line += f"\n  Usage: `!{cmd_name} {cmd_info.usage}`"
+                help_lines.append(line)
+
+            self._help_cache = "\n".join(help_lines)
+
+        # Help grows with every command; reply_long keeps it to one API call
+        await message.reply_long(self._help_cache)
         logger.debug("Help command executed")
 
     def get_commands(self) -> dict[str, CommandInfo]:
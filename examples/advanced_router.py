@@ -8,21 +8,30 @@ from datetime import datetime
 from discord_bridge import Bridge, ConfigurationError, setup_logging, CommandRouter
 
 
-async def main():
-    # Setup logging
-    logger = setup_logging(level=logging.INFO)
-    
-    # Create config if needed
-    if not os.path.exists("config.yaml"):
-        shutil.copy("config.yaml.example", "config.yaml")
-        logger.warning("Please configure config.yaml with your Discord token")
-        return
+# Messages are handled by a small pool of workers so a slow handler doesn't
+# hold up the rest. The bounded queue applies backpressure to listen().
+WORKER_COUNT = 8
+
+
+def ensure_config(logger) -> bool:
+    """Create config.yaml from the example on first run.
+
+    Runs before the event loop starts, so the file check and copy never
+    block it. Returns True if the bot can start.
+    """
+    if os.path.exists("config.yaml"):
+        return True
+    shutil.copy("config.yaml.example", "config.yaml")
+    logger.warning("Please configure config.yaml with your Discord token")
+    return False
+
 
+async def main(logger):
     # Initialize bridge
     try:
         bridge = Bridge(config_path="config.yaml")
     except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         return
 
     # Create command router
@@ -74,24 +83,55 @@ async def main():
             f"Type `!help` to see available commands."
         )
 
-    # Start the bot
-    bot_task = asyncio.create_task(bridge.run())
-    await bridge.wait_for_ready()
-    logger.info("Bot ready! Commands registered: " + ", ".join(router.get_commands().keys()))
+    # Main loop - hand messages to the workers, which use the router
+    queue = asyncio.Queue(maxsize=WORKER_COUNT * 4)
 
-    # Main loop - use the router to handle messages
-    try:
-        async for message in bridge.listen():
-            handled = await router.handle(message)
-            if not handled:
-                logger.warning(f"Unhandled message: {message.content}")
-    except asyncio.CancelledError:
-        logger.info("Shutting down...")
-        await bridge.stop()
+    async def worker():
+        while True:
+            message = await queue.get()
+            try:
+                handled = await router.handle(message)
+                if not handled:
+                    logger.warning("Unhandled message: %s", message.content)
+            except Exception as e:
+                logger.error("Error handling message: %s", e)
+            finally:
+                queue.task_done()
+
+    # The task group owns the bot and the workers: if bridge.run() fails,
+    # the rest is cancelled instead of waiting on a bot that is gone
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(bridge.run())
+        await bridge.wait_for_ready()
+        logger.info("Bot ready! Commands registered: %s", ", ".join(router.get_commands()))
+
+        workers = [tg.create_task(worker()) for _ in range(WORKER_COUNT)]
+
+        try:
+            async for message in bridge.listen():
+                await queue.put(message)
+            # Let the workers finish what is already queued
+            await queue.join()
+        except asyncio.CancelledError:
+            logger.info("Shutting down...")
+            await bridge.stop()
+        finally:
+            for task in workers:
+                task.cancel()
 
 
 if __name__ == "__main__":
+    # uvloop speeds up Discord's socket I/O; the default loop works fine too
     try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        print("\nShutdown complete.")
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    logger = setup_logging(level=logging.INFO)
+    if ensure_config(logger):
+        try:
+            asyncio.run(main(logger))
+        except KeyboardInterrupt:
+            print("\nShutdown complete.")
@@ -1,61 +1,124 @@
 """Example: Sending file attachments."""
 import asyncio
+import io
 import os
 import shutil
 import logging
-import tempfile
+import time
 
 from discord_bridge import Bridge, ConfigurationError, setup_logging, CommandRouter
 
 
-async def create_sample_file(content: str, filename: str) -> str:
-    """Create a temporary file with sample content."""
-    temp_dir = tempfile.gettempdir()
-    filepath = os.path.join(temp_dir, filename)
-    with open(filepath, "w") as f:
-        f.write(content)
-    return filepath
+# Messages are handled by a small pool of workers so a slow handler doesn't
+# hold up the rest. The bounded queue applies backpressure to listen().
+WORKER_COUNT = 8
 
+CSV_TEMPLATE = (
+    "Name,Value,Timestamp\n"
+    "Command,data_request,{time}\n"
+    "User,{author},{time}\n"
+    "Status,success,{time}\n"
+)
+
+
+class ReplyBatcher:
+    """Collect file replies and send each batch concurrently.
+
+    A single background task drains the queue, waiting up to BATCH_LINGER
+    seconds for more replies (at most BATCH_MAX) before sending them all with
+    asyncio.gather. submit() returns once its own reply has been sent.
+    """
+
+    BATCH_MAX = 32
+    BATCH_LINGER = 0.005
+
+    def __init__(self):
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    async def submit(self, message, **kwargs):
+        """Queue message.reply_with_file(**kwargs) and wait until it is sent."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((message, kwargs, future))
+        await future
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.BATCH_LINGER
+            while len(batch) < self.BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            results = await asyncio.gather(
+                *(message.reply_with_file(**kwargs) for message, kwargs, _ in batch),
+                return_exceptions=True,
+            )
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(None)
 
-async def main():
-    logger = setup_logging(level=logging.INFO)
-    
-    if not os.path.exists("config.yaml"):
-        shutil.copy("config.yaml.example", "config.yaml")
-        logger.warning("Please configure config.yaml")
-        return
 
+def create_sample_file(content: str, filename: str) -> tuple[io.BytesIO, str]:
+    """Build an in-memory file with sample content, ready for reply_with_file."""
+    return io.BytesIO(content.encode()), filename
+
+
+def ensure_config(logger) -> bool:
+    """Create config.yaml from the example on first run.
+
+    Runs before the event loop starts, so the file check and copy never
+    block it. Returns True if the bot can start.
+    """
+    if os.path.exists("config.yaml"):
+        return True
+    shutil.copy("config.yaml.example", "config.yaml")
+    logger.warning("Please configure config.yaml")
+    return False
+
+
+async def main(logger):
     try:
         bridge = Bridge(config_path="config.yaml")
     except ConfigurationError as e:
-        logger.error(f"Config error: {e}")
+        logger.error("Config error: %s", e)
         return
 
     router = CommandRouter()
+    batcher = ReplyBatcher()
 
     @router.command("textfile", description="Send a sample text file")
     async def textfile_handler(message, args):
         """Send a text file attachment."""
-        content = f"Hello {message.author_name}!\n\nThis is a sample text file.\nGenerated at: {asyncio.get_event_loop().time()}"
-        filepath = await create_sample_file(content, f"hello_{message.author_id}.txt")
-        
-        try:
-            await message.reply_with_file(
-                content="Here's your personalized text file!",
-                file_path=filepath
-            )
-            logger.info(f"Sent text file to {message.author_name}")
-        finally:
-            # Clean up temp file
-            if os.path.exists(filepath):
-                os.remove(filepath)
+        content = f"Hello {message.author_name}!\n\nThis is a sample text file.\nGenerated at: {time.monotonic()}"
+        fp, filename = create_sample_file(content, "hello_%d.txt" % message.author_id)
+
+        await batcher.submit(
+            message,
+            content="Here's your personalized text file!",
+            fp=fp,
+            filename=filename
+        )
+        logger.info("Sent text file to %s", message.author_name)
 
     @router.command("log", description="Generate a sample log file")
     async def log_handler(message, args):
         """Send a log file attachment."""
         log_content = f"""Bot Log - User Request
 ========================
-Timestamp: {asyncio.get_event_loop().time()}
+Timestamp: {time.monotonic()}
 User: {message.author_name}
 User ID: {message.author_id}
 Channel ID: {message.channel_id}
@@ -63,53 +126,73 @@ Is DM: {message.is_dm}
 
 Processing complete!
 """
-        filepath = await create_sample_file(log_content, f"log_{message.author_id}.log")
-        
-        try:
-            await message.reply_with_file(
-                content="Here's your activity log:",
-                file_path=filepath,
-                filename="activity.log"
-            )
-        finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+        fp, filename = create_sample_file(log_content, "activity.log")
+
+        await batcher.submit(
+            message,
+            content="Here's your activity log:",
+            fp=fp,
+            filename=filename
+        )
 
     @router.command("data", description="Send sample data as CSV")
     async def data_handler(message, args):
         """Send a CSV file."""
-        csv_content = """Name,Value,Timestamp
-Command,data_request,{time}
-User,{author},{time}
-Status,success,{time}
-""".format(
-            author=message.author_name,
-            time=asyncio.get_event_loop().time()
+        csv_content = CSV_TEMPLATE.format_map(
+            {"author": message.author_name, "time": time.monotonic()}
         )
         
-        filepath = await create_sample_file(csv_content, f"data_{message.author_id}.csv")
-        
+        fp, filename = create_sample_file(csv_content, "data_export.csv")
+
+        await batcher.submit(
+            message,
+            content="Here's your data export:",
+            fp=fp,
+            filename=filename
+        )
+
+    queue = asyncio.Queue(maxsize=WORKER_COUNT * 4)
+
+    async def worker():
+        while True:
+            message = await queue.get()
+            try:
+                await router.handle(message)
+            except Exception as e:
+                logger.error("Error handling message: %s", e)
+            finally:
+                queue.task_done()
+
+    # The task group owns the bot and the workers: if bridge.run() fails,
+    # the rest is cancelled instead of waiting on a bot that is gone
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(bridge.run())
+        await bridge.wait_for_ready()
+        logger.info("Attachment example bot ready!")
+
+        workers = [tg.create_task(worker()) for _ in range(WORKER_COUNT)]
+
         try:
-            await message.reply_with_file(
-                content="Here's your data export:",
-                file_path=filepath,
-                filename="data_export.csv"
-            )
+            async for message in bridge.listen():
+                await queue.put(message)
+            # Let the workers finish what is already queued
+            await queue.join()
+        except asyncio.CancelledError:
+            await bridge.stop()
         finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            for task in workers:
+                task.cancel()
 
-    # Start bot
-    bot_task = asyncio.create_task(bridge.run())
-    await bridge.wait_for_ready()
-    logger.info("Attachment example bot ready!")
 
+if __name__ == "__main__":
+    # uvloop speeds up Discord's socket I/O; the default loop works fine too
     try:
-        async for message in bridge.listen():
-            await router.handle(message)
-    except asyncio.CancelledError:
-        await bridge.stop()
-
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-if __name__ == "__main__":
-    asyncio.run(main())
+    logger = setup_logging(level=logging.INFO)
+    if ensure_config(logger):
+        asyncio.run(main(logger))
@@ -3,22 +3,40 @@ import asyncio
 import os
 import shutil
 import logging
+from collections import deque
 
 from discord_bridge import Bridge, ConfigurationError, setup_logging, CommandRouter
 
 
-async def main():
-    logger = setup_logging(level=logging.INFO)
-    
-    if not os.path.exists("config.yaml"):
-        shutil.copy("config.yaml.example", "config.yaml")
-        logger.warning("Please configure config.yaml")
-        return
+# Messages are handled by a small pool of workers so a slow handler doesn't
+# hold up the rest. The bounded queue applies backpressure to listen().
+WORKER_COUNT = 8
+
+# Incoming messages are logged in batches: buffered as they arrive and
+# written as one record every LOG_FLUSH_INTERVAL seconds. Under a flood the
+# oldest entries beyond LOG_BUFFER_SIZE are dropped.
+LOG_BUFFER_SIZE = 1024
+LOG_FLUSH_INTERVAL = 0.1
 
+
+def ensure_config(logger) -> bool:
+    """Create config.yaml from the example on first run.
+
+    Runs before the event loop starts, so the file check and copy never
+    block it. Returns True if the bot can start.
+    """
+    if os.path.exists("config.yaml"):
+        return True
+    shutil.copy("config.yaml.example", "config.yaml")
+    logger.warning("Please configure config.yaml")
+    return False
+
+
+async def main(logger):
     try:
         bridge = Bridge(config_path="config.yaml")
     except ConfigurationError as e:
-        logger.error(f"Config error: {e}")
+        logger.error("Config error: %s", e)
         return
 
     router = CommandRouter()
@@ -96,26 +114,81 @@ async def main():
         await message.reply(f" Broadcasting: {args}")
 
     # Log all incoming messages to show DM vs Channel distinction
-    async def message_logger(message):
-        """Log whether message is DM or channel."""
+    log_buffer = deque(maxlen=LOG_BUFFER_SIZE)
+
+    # Nothing here awaits, so it is a plain function rather than a coroutine
+    def message_logger(message):
+        """Record whether message is DM or channel for the next log flush."""
         msg_type = "DM" if message.is_dm else "Channel"
-        logger.info(f"[{msg_type}] {message.author_name}: {message.content}")
-        return True
+        log_buffer.append((msg_type, message.author_name, message.content))
 
-    # Start bot
-    bot_task = asyncio.create_task(bridge.run())
-    await bridge.wait_for_ready()
-    logger.info("DM handler bot ready!")
+    def flush_log_buffer():
+        """Write all buffered messages as a single log record."""
+        if not log_buffer:
+            return
+        entries = [log_buffer.popleft() for _ in range(len(log_buffer))]
+        # Only build the combined text if INFO records are actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s",
+                "\n".join(
+                    f"[{msg_type}] {author}: {content}" for msg_type, author, content in entries
+                ),
+            )
 
-    try:
-        async for message in bridge.listen():
-            # Log message type
-            await message_logger(message)
-            # Handle command
-            await router.handle(message)
-    except asyncio.CancelledError:
-        await bridge.stop()
+    async def log_flusher():
+        while True:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            flush_log_buffer()
+
+    queue = asyncio.Queue(maxsize=WORKER_COUNT * 4)
+
+    async def worker():
+        while True:
+            message = await queue.get()
+            try:
+                # Log message type
+                message_logger(message)
+                # Handle command
+                await router.handle(message)
+            except Exception as e:
+                logger.error("Error handling message: %s", e)
+            finally:
+                queue.task_done()
+
+    # The task group owns the bot and the workers: if bridge.run() fails,
+    # the rest is cancelled instead of waiting on a bot that is gone
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(bridge.run())
+        await bridge.wait_for_ready()
+        logger.info("DM handler bot ready!")
+
+        workers = [tg.create_task(worker()) for _ in range(WORKER_COUNT)]
+        flusher = tg.create_task(log_flusher())
+
+        try:
+            async for message in bridge.listen():
+                await queue.put(message)
+            # Let the workers finish what is already queued
+            await queue.join()
+        except asyncio.CancelledError:
+            await bridge.stop()
+        finally:
+            for task in workers:
+                task.cancel()
+            flusher.cancel()
+            flush_log_buffer()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop speeds up Discord's socket I/O; the default loop works fine too
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    logger = setup_logging(level=logging.INFO)
+    if ensure_config(logger):
+        asyncio.run(main(logger))
@@ -4,22 +4,63 @@ import os
 import shutil
 import logging
 from datetime import datetime
+from types import MappingProxyType
 
 from discord_bridge import Bridge, ConfigurationError, setup_logging, CommandRouter
 
 
-async def main():
-    logger = setup_logging(level=logging.INFO)
-    
-    if not os.path.exists("config.yaml"):
-        shutil.copy("config.yaml.example", "config.yaml")
-        logger.warning("Please configure config.yaml")
-        return
+# Messages are handled by a small pool of workers so a slow handler doesn't
+# hold up the rest. The bounded queue applies backpressure to listen().
+WORKER_COUNT = 8
+
+# Embeds that never change are built once, as read-only fields
+STATUS_FIELDS = (
+    MappingProxyType({"name": "Uptime", "value": "Online", "inline": True}),
+    MappingProxyType({"name": "Version", "value": "2.0.0", "inline": True}),
+)
+
+SERVER_EMBED = MappingProxyType({
+    "title": "Server Information",
+    "description": "This is an example embed with rich formatting",
+    "color": 0x3498DB,  # Blue
+    "fields": (
+        MappingProxyType({"name": "Feature 1", "value": "Automatic message splitting", "inline": False}),
+        MappingProxyType({"name": "Feature 2", "value": "Rate limit protection", "inline": False}),
+        MappingProxyType({"name": "Feature 3", "value": "Command routing", "inline": False}),
+        MappingProxyType({"name": "Feature 4", "value": "Rich embeds", "inline": False}),
+    ),
+    "footer": "discord_bridge - Making Discord bots simple",
+})
+
+ERROR_EMBED = MappingProxyType({
+    "title": "Error Example",
+    "description": "This is what an error embed looks like",
+    "color": 0xFF0000,  # Red
+    "fields": (
+        MappingProxyType({"name": "Error Code", "value": "404", "inline": True}),
+        MappingProxyType({"name": "Status", "value": "Not Found", "inline": True}),
+    ),
+})
+
+
+def ensure_config(logger) -> bool:
+    """Create config.yaml from the example on first run.
+
+    Runs before the event loop starts, so the file check and copy never
+    block it. Returns True if the bot can start.
+    """
+    if os.path.exists("config.yaml"):
+        return True
+    shutil.copy("config.yaml.example", "config.yaml")
+    logger.warning("Please configure config.yaml")
+    return False
+
 
+async def main(logger):
     try:
         bridge = Bridge(config_path="config.yaml")
     except ConfigurationError as e:
-        logger.error(f"Config error: {e}")
+        logger.error("Config error: %s", e)
         return
 
     router = CommandRouter()
@@ -27,47 +68,17 @@ async def main():
     @router.command("status", description="Show bot status")
     async def status_handler(message, args):
         """Send a status embed."""
-        await message.reply_with_embed(
-            title="Bot Status",
-            description="Everything is running smoothly!",
-            color=0x00FF00,  # Green
-            fields=[
-                {"name": "Uptime", "value": "Online", "inline": True},
-                {"name": "Version", "value": "2.0.0", "inline": True},
-                {"name": "Commands", "value": str(len(router.get_commands())), "inline": True}
-            ],
-            footer="Powered by discord_bridge",
-            thumbnail_url="https://cdn.discordapp.com/embed/avatars/0.png"
-        )
+        await message.reply_with_embed(**status_embed)
 
     @router.command("server", description="Show server information")
     async def server_handler(message, args):
         """Send server info embed."""
-        await message.reply_with_embed(
-            title="Server Information",
-            description="This is an example embed with rich formatting",
-            color=0x3498DB,  # Blue
-            fields=[
-                {"name": "Feature 1", "value": "Automatic message splitting", "inline": False},
-                {"name": "Feature 2", "value": "Rate limit protection", "inline": False},
-                {"name": "Feature 3", "value": "Command routing", "inline": False},
-                {"name": "Feature 4", "value": "Rich embeds", "inline": False}
-            ],
-            footer="discord_bridge - Making Discord bots simple"
-        )
+        await message.reply_with_embed(**SERVER_EMBED)
 
     @router.command("error", description="Show error example")
     async def error_handler(message, args):
         """Send an error-style embed."""
-        await message.reply_with_embed(
-            title="Error Example",
-            description="This is what an error embed looks like",
-            color=0xFF0000,  # Red
-            fields=[
-                {"name": "Error Code", "value": "404", "inline": True},
-                {"name": "Status", "value": "Not Found", "inline": True}
-            ]
-        )
+        await message.reply_with_embed(**ERROR_EMBED)
 
     @router.command("colors", description="Show different embed colors")
     async def colors_handler(message, args):
@@ -81,25 +92,72 @@ async def main():
             (0x00FFFF, "Cyan", "#00FFFF")
         ]
         
-        for color, name, hex_code in colors:
-            await message.reply_with_embed(
+        # The per-channel rate limiter paces these, so no manual delay is needed
+        await asyncio.gather(*(
+            message.reply_with_embed(
                 title=f"{name} Color",
                 description=f"Hex code: {hex_code}",
                 color=color
             )
-            await asyncio.sleep(0.5)  # Small delay between embeds
+            for color, name, hex_code in colors
+        ))
 
-    # Start bot
-    bot_task = asyncio.create_task(bridge.run())
-    await bridge.wait_for_ready()
-    logger.info("Embed example bot ready!")
+    # Commands are all registered by now, so /status can be built once
+    command_count = str(len(router.get_commands()))
+    status_embed = MappingProxyType({
+        "title": "Bot Status",
+        "description": "Everything is running smoothly!",
+        "color": 0x00FF00,  # Green
+        "fields": (
+            *STATUS_FIELDS,
+            MappingProxyType({"name": "Commands", "value": command_count, "inline": True}),
+        ),
+        "footer": "Powered by discord_bridge",
+        "thumbnail_url": "https://cdn.discordapp.com/embed/avatars/0.png",
+    })
 
-    try:
-        async for message in bridge.listen():
-            await router.handle(message)
-    except asyncio.CancelledError:
-        await bridge.stop()
+    queue = asyncio.Queue(maxsize=WORKER_COUNT * 4)
+
+    async def worker():
+        while True:
+            message = await queue.get()
+            try:
+                await router.handle(message)
+            except Exception as e:
+                logger.error("Error handling message: %s", e)
+            finally:
+                queue.task_done()
+
+    # The task group owns the bot and the workers: if bridge.run() fails,
+    # the rest is cancelled instead of waiting on a bot that is gone
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(bridge.run())
+        await bridge.wait_for_ready()
+        logger.info("Embed example bot ready!")
+
+        workers = [tg.create_task(worker()) for _ in range(WORKER_COUNT)]
+
+        try:
+            async for message in bridge.listen():
+                await queue.put(message)
+            # Let the workers finish what is already queued
+            await queue.join()
+        except asyncio.CancelledError:
+            await bridge.stop()
+        finally:
+            for task in workers:
+                task.cancel()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop speeds up Discord's socket I/O; the default loop works fine too
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    logger = setup_logging(level=logging.INFO)
+    if ensure_config(logger):
+        asyncio.run(main(logger))
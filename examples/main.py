@@ -6,86 +6,128 @@ import logging
 from discord_bridge import Bridge, ConfigurationError, setup_logging
 
 
+# Messages are handled by a small pool of workers so a slow handler doesn't
+# hold up the rest. The bounded queue applies backpressure to listen().
+WORKER_COUNT = 8
+
+
 # --- Example AI Function ---
 async def get_ai_response(prompt: str) -> str:
     """A simple function that simulates an AI processing a message."""
-    logging.getLogger("discord_bridge").info(f"AI processing prompt: '{prompt}'")
+    logging.getLogger("discord_bridge").info("AI processing prompt: '%s'", prompt)
     # In a real app, this would call OpenAI, Gemini, etc.
     await asyncio.sleep(0.5)  # Simulate network latency
     return f"The AI processed your prompt: '{prompt}'"
 
 
-async def main():
-    # Setup logging first
-    logger = setup_logging(level=logging.INFO)
-    
-    # --- Initial Setup ---
-    # Create a real config file from the example if it doesn't exist
-    if not os.path.exists("config.yaml"):
-        logger.info("config.yaml not found, creating one from example...")
-        try:
-            shutil.copy("config.yaml.example", "config.yaml")
-            logger.warning("IMPORTANT: Please open 'config.yaml' and fill in your 'discord_token'.")
-            return
-        except FileNotFoundError:
-            logger.error("ERROR: config.yaml.example not found! Please create a config.yaml.")
-            return
+# --- Initial Setup ---
+def ensure_config(logger) -> bool:
+    """Create a real config file from the example if it doesn't exist.
+
+    Runs before the event loop starts, so the file check and copy never
+    block it. Returns True if the bot can start.
+    """
+    if os.path.exists("config.yaml"):
+        return True
+    logger.info("config.yaml not found, creating one from example...")
+    try:
+        shutil.copy("config.yaml.example", "config.yaml")
+        logger.warning("IMPORTANT: Please open 'config.yaml' and fill in your 'discord_token'.")
+    except FileNotFoundError:
+        logger.error("ERROR: config.yaml.example not found! Please create a config.yaml.")
+    return False
 
+
+async def main(logger):
     # --- Bot Initialization ---
     try:
         bridge = Bridge(config_path="config.yaml")
     except ConfigurationError as e:
-        logger.error(f"Configuration failed: {e}")
+        logger.error("Configuration failed: %s", e)
         logger.error("Please ensure your 'config.yaml' is set up correctly.")
         return
 
-    # Create a task to run the bot in the background
-    bot_task = asyncio.create_task(bridge.run())
-    
-    logger.info("Bot is starting... waiting for it to be ready.")
-    await bridge.wait_for_ready()
-    logger.info("Bridge is connected and ready! Listening for commands...")
+    async def handle_message(message):
+        try:
+            logger.info("Received command from %s: '%s'", message.author_name, message.content)
 
-    # --- Main Application Loop ---
-    # Start listening for commands from Discord
-    try:
-        async for message in bridge.listen():
+            # Get a response from our application logic (the "AI")
+            response_text = await get_ai_response(message.content)
+
+            # Send the response back to the same channel
+            await message.reply(response_text)
+            logger.info("Replied to %s", message.author_name)
+
+        except Exception as e:
+            logger.error("Error processing message: %s", e)
+            # Attempt to send an error message back to the user
             try:
-                logger.info(f"Received command from {message.author_name}: '{message.content}'")
-                
-                # Get a response from our application logic (the "AI")
-                response_text = await get_ai_response(message.content)
-
-                # Send the response back to the same channel
-                await message.reply(response_text)
-                logger.info(f"Replied to {message.author_name}")
-
-            except Exception as e:
-                logger.error(f"Error processing message: {e}")
-                # Attempt to send an error message back to the user
-                try:
-                    await message.reply("Sorry, an error occurred while processing your request.")
-                except Exception as reply_e:
-                    logger.error(f"Failed to send error reply: {reply_e}")
-    
-    except asyncio.CancelledError:
-        logger.info("Received shutdown signal, stopping gracefully...")
-        await bridge.stop()
-        await bot_task
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt, shutting down...")
-        await bridge.stop()
-        await bot_task
-    except Exception as e:
-        logger.error(f"Unexpected error in main loop: {e}")
-        await bridge.stop()
-        await bot_task
+                await message.reply("Sorry, an error occurred while processing your request.")
+            except Exception as reply_e:
+                logger.error("Failed to send error reply: %s", reply_e)
+
+    # Workers process messages concurrently, so one slow AI call doesn't
+    # delay everyone else's replies
+    queue = asyncio.Queue(maxsize=WORKER_COUNT * 4)
+
+    async def worker():
+        while True:
+            message = await queue.get()
+            try:
+                await handle_message(message)
+            finally:
+                queue.task_done()
+
+    # The task group owns the bot and the workers: if bridge.run() fails,
+    # the rest is cancelled instead of waiting on a bot that is gone. Leaving
+    # the group waits for bridge.run() to return after bridge.stop().
+    async with asyncio.TaskGroup() as tg:
+        # Run the bot in the background
+        tg.create_task(bridge.run())
+
+        logger.info("Bot is starting... waiting for it to be ready.")
+        await bridge.wait_for_ready()
+        logger.info("Bridge is connected and ready! Listening for commands...")
+
+        workers = [tg.create_task(worker()) for _ in range(WORKER_COUNT)]
+
+        # --- Main Application Loop ---
+        # Start listening for commands from Discord
+        try:
+            async for message in bridge.listen():
+                await queue.put(message)
+            # Let the workers finish what is already queued
+            await queue.join()
+
+        except asyncio.CancelledError:
+            logger.info("Received shutdown signal, stopping gracefully...")
+            await bridge.stop()
+        except KeyboardInterrupt:
+            logger.info("Received keyboard interrupt, shutting down...")
+            await bridge.stop()
+        except Exception as e:
+            logger.error("Unexpected error in main loop: %s", e)
+            await bridge.stop()
+        finally:
+            for task in workers:
+                task.cancel()
 
 
 if __name__ == "__main__":
+    # uvloop speeds up Discord's socket I/O; the default loop works fine too
     try:
-        asyncio.run(main())
-    except KeyboardInterrupt:
-        print("\nShutting down bot.")
-    except Exception as e:
-        print(f"\nAn unexpected error occurred in main: {e}")
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    # Setup logging first
+    logger = setup_logging(level=logging.INFO)
+    if ensure_config(logger):
+        try:
+            asyncio.run(main(logger))
+        except KeyboardInterrupt:
+            print("\nShutting down bot.")
+        except Exception as e:
+            print(f"\nAn unexpected error occurred in main: {e}")
@@ -1,8 +1,8 @@
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from discord_bridge import Bridge, SmartMessage
+from discord_bridge import Bridge, ReconnectExhaustedError, SmartMessage
 
 # Mark all tests in this file as async
 pytestmark = pytest.mark.asyncio
@@ -12,10 +12,19 @@ pytestmark = pytest.mark.asyncio
 @pytest.fixture(autouse=True)
 def mock_config_load():
     with patch("discord_bridge.bridge.load_config") as mock_load:
-        # Provide a dummy token and prefix for all tests
-        mock_load.return_value = ("dummy_token", "!")
+        # Provide dummy values for every field returned by load_config
+        mock_load.return_value = ("dummy_token", "!", [], 5, 1.0, 1.0, 5)
         yield mock_load
 
+
+@pytest.fixture
+def ready_bridge(mock_config_load):
+    """A Bridge that has seen on_ready, with bot user ID 999."""
+    bridge = Bridge("config.yaml")
+    bridge.is_ready = True
+    bridge.bot_user_id = 999
+    return bridge
+
 async def test_listen_yields_message_from_queue():
     bridge = Bridge("config.yaml")
     # Manually create the queue for the test
@@ -28,8 +37,8 @@ async def test_listen_yields_message_from_queue():
     mock_discord_msg.channel.id = 456
     smart_msg = SmartMessage(mock_discord_msg, "!")
 
-    # Put the message into the queue
-    await bridge._incoming_queue.put(smart_msg)
+    # Put a batch containing the message into the queue
+    await bridge._incoming_queue.put([smart_msg])
 
     # Listen for the message
     async def listen_and_check():
@@ -40,53 +49,247 @@ async def test_listen_yields_message_from_queue():
     # Run the listener with a timeout
     await asyncio.wait_for(listen_and_check(), timeout=1.0)
 
-async def test_on_message_handler_puts_to_queue():
+@pytest.mark.parametrize(
+    "author_id,bot_id,content,expect_queued",
+    [
+        (123, 999, "!hello", True),
+        (123, 123, "!hello", False),  # The bot's own message
+        (123, 999, "hello world", False),  # No prefix
+    ],
+    ids=["user_command", "ignores_self", "ignores_no_prefix"],
+)
+async def test_on_message_handler(ready_bridge, author_id, bot_id, content, expect_queued):
+    ready_bridge.bot_user_id = bot_id
+
+    discord_msg = Mock()
+    discord_msg.author.id = author_id
+    discord_msg.content = content
+
+    # Simulate the on_message event and publish the pending batch
+    await ready_bridge._handle_on_message(discord_msg)
+    ready_bridge._flush_batch()
+
+    if expect_queued:
+        batch = ready_bridge._incoming_queue.get_nowait()
+        assert len(batch) == 1
+        assert isinstance(batch[0], SmartMessage)
+        assert batch[0].content == "hello"
+    else:
+        assert ready_bridge._incoming_queue.empty()
+
+async def test_drain_queue_waits_for_dequeued_batches():
     bridge = Bridge("config.yaml")
-    bridge.is_ready = True # Pretend the bot is ready
-    # The prefix is now set by the mock_config_load fixture
-    # bridge.prefix = "!" 
-    bridge.bot_user_id = 999 # Set a fake bot id
-    bridge._incoming_queue = asyncio.Queue()
 
-    # Create a message from a user
-    user_msg = Mock()
-    user_msg.author.id = 123
-    user_msg.content = "!hello"
+    mock_discord_msg = Mock()
+    mock_discord_msg.content = "!test"
+    await bridge._incoming_queue.put([SmartMessage(mock_discord_msg, "!")])
 
-    # Simulate the on_message event
-    await bridge._handle_on_message(user_msg)
-    
-    # Check that the message arrived in the queue
-    received = await asyncio.wait_for(bridge._incoming_queue.get(), timeout=1.0)
-    assert isinstance(received, SmartMessage)
-    assert received.content == "hello"
+    # The batch is still queued, so the drain has to wait
+    drain_task = asyncio.create_task(bridge._drain_queue())
+    await asyncio.sleep(0)
+    assert not drain_task.done()
+
+    # Handing the batch out to a consumer completes the drain
+    listener = bridge.listen()
+    await listener.__anext__()
+    await asyncio.wait_for(drain_task, timeout=1.0)
+    await listener.aclose()
+
+
+async def test_stop_from_inside_listen_loop():
+    bridge = Bridge("config.yaml")
+    bridge._client = Mock()
+    bridge._client.close = AsyncMock()
+
+    messages = []
+    for content in ("!one", "!two"):
+        mock_discord_msg = Mock()
+        mock_discord_msg.content = content
+        messages.append(SmartMessage(mock_discord_msg, "!"))
+    await bridge._incoming_queue.put(messages)
 
-async def test_on_message_handler_ignores_self():
+    received = []
+    async for message in bridge.listen():
+        received.append(message)
+        if len(received) == 1:
+            await asyncio.wait_for(bridge.stop(), timeout=1.0)
+
+    # The rest of the in-flight batch is still delivered before listen() exits
+    assert received == messages
+
+
+async def test_listen_stops_on_shutdown_sentinel():
+    bridge = Bridge("config.yaml")
+
+    mock_discord_msg = Mock()
+    mock_discord_msg.content = "!test"
+    smart_msg = SmartMessage(mock_discord_msg, "!")
+    await bridge._incoming_queue.put([smart_msg])
+    await bridge._incoming_queue.put(None)
+
+    # Messages queued before the sentinel are still delivered
+    received = [m async for m in bridge.listen()]
+    assert received == [smart_msg]
+    await asyncio.wait_for(bridge._drain_queue(), timeout=1.0)
+
+
+async def test_on_message_handler_ignores_non_whitelisted_channel(mock_config_load):
+    mock_config_load.return_value = ("dummy_token", "!", [456], 5, 1.0, 1.0, 5)
     bridge = Bridge("config.yaml")
     bridge.is_ready = True
-    bridge.bot_user_id = 123 # Bot's own ID
-    bridge._incoming_queue = asyncio.Queue()
+    bridge.bot_user_id = 999
+    assert bridge.allowed_channels == frozenset({456})
 
-    # Create a message from the bot itself
-    bot_msg = Mock()
-    bot_msg.author.id = 123 
-    bot_msg.content = "!hello"
+    # Create a message from a channel that is not whitelisted
+    other_channel_msg = Mock()
+    other_channel_msg.author.id = 123
+    other_channel_msg.content = "!hello"
+    other_channel_msg.channel.id = 789
 
-    # Simulate the event and assert the queue remains empty
-    await bridge._handle_on_message(bot_msg)
+    await bridge._handle_on_message(other_channel_msg)
+    # Flush first so a message sitting in the pending batch would be caught
+    bridge._flush_batch()
+    assert bridge._batch == []
     assert bridge._incoming_queue.empty()
 
-async def test_on_message_handler_ignores_no_prefix():
-    bridge = Bridge("config.yaml")
+
+async def test_on_message_handler_flushes_full_batch(ready_bridge):
+    bridge = ready_bridge
+
+    for i in range(Bridge.BATCH_MAX_SIZE):
+        user_msg = Mock()
+        user_msg.author.id = 123
+        user_msg.content = f"!hello {i}"
+        await bridge._handle_on_message(user_msg)
+
+    # A full batch is published immediately, without waiting for the linger timer
+    batch = bridge._incoming_queue.get_nowait()
+    assert [m.content for m in batch] == [f"hello {i}" for i in range(Bridge.BATCH_MAX_SIZE)]
+    assert bridge._flush_handle is None
+
+
+async def test_listen_recycles_messages_when_enabled():
+    bridge = Bridge("config.yaml", recycle_messages=True)
     bridge.is_ready = True
     bridge.bot_user_id = 999
-    bridge._incoming_queue = asyncio.Queue()
 
-    # Create a message without the prefix
-    no_prefix_msg = Mock()
-    no_prefix_msg.author.id = 123
-    no_prefix_msg.content = "hello world"
+    first_msg = Mock()
+    first_msg.author.id = 123
+    first_msg.content = "!first"
+    await bridge._handle_on_message(first_msg)
+    bridge._flush_batch()
+
+    listener = bridge.listen()
+    first = await listener.__anext__()
+    assert first.content == "first"
+
+    # Asking for the next message returns the first one to the pool
+    next_task = asyncio.create_task(listener.__anext__())
+    await asyncio.sleep(0)
+    assert list(bridge._smart_pool) == [first]
+
+    second_msg = Mock()
+    second_msg.author.id = 456
+    second_msg.content = "!second"
+    await bridge._handle_on_message(second_msg)
+    bridge._flush_batch()
+
+    # The pooled SmartMessage is reinitialized for the second message
+    second = await asyncio.wait_for(next_task, timeout=1.0)
+    assert second is first
+    assert second.content == "second"
+    assert second.author_id == 456
+    await listener.aclose()
+
+
+async def test_acquire_send_token_uses_per_channel_buckets(mock_config_load):
+    mock_config_load.return_value = ("dummy_token", "!", [], 5, 1.0, 1.0, 2)
+    bridge = Bridge("config.yaml")
+
+    # The burst allowance is tracked separately for each channel
+    await bridge.acquire_send_token(1)
+    await bridge.acquire_send_token(1)
+    await bridge.acquire_send_token(2)
+
+    assert bridge._send_buckets[1].tokens < 1.0
+    assert bridge._send_buckets[2].tokens >= 1.0
+
+
+async def test_connect_with_retry_drops_last_error_traceback(mock_config_load):
+    mock_config_load.return_value = ("dummy_token", "!", [], 2, 1.0, 1.0, 5)
+    bridge = Bridge("config.yaml")
+    bridge._client.start = AsyncMock(side_effect=OSError("network down"))
+
+    with pytest.raises(ReconnectExhaustedError) as exc_info:
+        await bridge._connect_with_retry()
+
+    assert exc_info.value.attempts == 2
+    assert isinstance(exc_info.value.last_error, OSError)
+    assert exc_info.value.last_error.__traceback__ is None
+
+
+async def test_wait_for_ready_resolves_on_ready():
+    bridge = Bridge("config.yaml")
+    bridge._client = Mock()
+    bridge._client.user.id = 999
+
+    waiter = asyncio.create_task(bridge.wait_for_ready())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await bridge._handle_on_ready()
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert bridge.is_ready
+    assert bridge.bot_user_id == 999
+
+    # A second on_ready (e.g. after a reconnect) must not fail
+    await bridge._handle_on_ready()
+
+
+async def test_stop_without_listener_returns_promptly():
+    bridge = Bridge("config.yaml")
+    bridge._client = Mock()
+    bridge._client.close = AsyncMock()
+
+    # Nothing is consuming the queue, so the shutdown sentinel must not be awaited
+    await asyncio.wait_for(bridge.stop(), timeout=1.0)
+    bridge._client.close.assert_awaited_once()
+
+
+async def test_reassigning_prefix_and_channels_updates_filter(ready_bridge):
+    bridge = ready_bridge
+    bridge.prefix = "?"
+    bridge.allowed_channels = [456]
+    assert bridge.allowed_channels == frozenset({456})
+
+    message = Mock()
+    message.author.id = 123
+    message.content = "?hello"
+    message.channel.id = 456
+    await bridge._handle_on_message(message)
+
+    # The old prefix and non-whitelisted channels are now rejected
+    for content, channel_id in (("!hello", 456), ("?hello", 789)):
+        rejected = Mock()
+        rejected.author.id = 123
+        rejected.content = content
+        rejected.channel.id = channel_id
+        await bridge._handle_on_message(rejected)
+
+    bridge._flush_batch()
+    batch = bridge._incoming_queue.get_nowait()
+    assert [m.content for m in batch] == ["hello"]
+
+
+async def test_connect_with_retry_backoff_grows_after_burst(mock_config_load):
+    mock_config_load.return_value = ("dummy_token", "!", [], 6, 1.0, 1.0, 5)
+    bridge = Bridge("config.yaml")
+    bridge._client.start = AsyncMock(side_effect=OSError("network down"))
+
+    with patch("discord_bridge.bridge.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(ReconnectExhaustedError):
+            await bridge._connect_with_retry()
 
-    # Simulate the event and assert the queue remains empty
-    await bridge._handle_on_message(no_prefix_msg)
-    assert bridge._incoming_queue.empty()
\ No newline at end of file
+    # Two immediate retries, then the delay doubles from reconnect_base_delay
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert delays == pytest.approx([1.0, 2.0, 4.0], abs=0.01)
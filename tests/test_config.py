@@ -1,4 +1,6 @@
+import os
 import pytest
+from unittest.mock import patch
 from pathlib import Path
 import yaml
 from discord_bridge.config import load_config, BridgeConfig
@@ -18,12 +20,14 @@ def test_load_config_success(tmp_path: Path):
     with open(config_file, "w") as f:
         yaml.dump(config_content, f)
 
-    token, prefix, channels, max_retries, delay = load_config(config_file)
+    token, prefix, channels, max_retries, delay, rate, burst = load_config(config_file)
     assert token == "test_token_12345"
     assert prefix == "!"
     assert channels == []
     assert max_retries == 5
     assert delay == 1.0
+    assert rate == 1.0
+    assert burst == 5
 
 
 def test_load_config_with_channels(tmp_path: Path):
@@ -39,7 +43,7 @@ def test_load_config_with_channels(tmp_path: Path):
     with open(config_file, "w") as f:
         yaml.dump(config_content, f)
 
-    token, prefix, channels, max_retries, delay = load_config(config_file)
+    token, prefix, channels, max_retries, delay, rate, burst = load_config(config_file)
     assert token == "test_token_12345"
     assert prefix == "?"
     assert channels == [123456789, 987654321]
@@ -82,3 +86,24 @@ def test_bridge_config_defaults():
     assert config.allowed_channel_ids == []
     assert config.max_reconnect_attempts == 5
     assert config.reconnect_base_delay == 1.0
+    assert config.send_rate == 1.0
+    assert config.send_burst == 5
+
+
+def test_load_config_is_cached_until_file_changes(tmp_path: Path):
+    """Test that load_config reuses the parsed config until the file's mtime changes."""
+    config_file = tmp_path / "config.yaml"
+    with open(config_file, "w") as f:
+        yaml.dump({"discord_token": "first_token"}, f)
+
+    assert load_config(config_file)[0] == "first_token"
+    with patch("discord_bridge.config.BridgeConfig") as mock_model:
+        assert load_config(config_file)[0] == "first_token"
+        mock_model.assert_not_called()
+
+    with open(config_file, "w") as f:
+        yaml.dump({"discord_token": "second_token"}, f)
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_config(config_file)[0] == "second_token"
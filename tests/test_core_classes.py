@@ -1,6 +1,11 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
 from discord_bridge.message import SmartMessage
 from discord_bridge.bridge import Bridge
+from discord_bridge.ratelimit import TokenBucket
+from discord_bridge.exceptions import ConfigurationError
 
 
 def test_smart_message_properties():
@@ -20,9 +25,81 @@ def test_smart_message_properties():
     assert smart_msg.channel_id == 456
 
 
-def test_bridge_initialization():
+def test_smart_message_precomputed_prefix_len():
+    """Test that a precomputed prefix length slices the prefix off directly."""
+    mock_discord_msg = Mock()
+    mock_discord_msg.content = ">>ping  "
+
+    smart_msg = SmartMessage(mock_discord_msg, ">>", prefix_len=2)
+
+    assert smart_msg.content == "ping"
+
+
+def test_smart_message_keeps_only_the_channel():
+    """Test that SmartMessage doesn't hold on to the original discord.Message."""
+    mock_discord_msg = Mock()
+    mock_discord_msg.content = "!ping"
+
+    smart_msg = SmartMessage(mock_discord_msg, "!")
+
+    assert smart_msg._channel is mock_discord_msg.channel
+    assert not hasattr(smart_msg, "__dict__")
+
+
+@patch("discord_bridge.bridge.load_config", return_value=("dummy_token", "!", [], 5, 1.0, 1.0, 5))
+def test_bridge_initialization(mock_load):
     """Test that Bridge initializes with correct default values."""
     bridge = Bridge("path/to/config.yaml")
     assert bridge.config_path == "path/to/config.yaml"
     assert not bridge.is_ready
     assert bridge.bot_user_id is None
+
+
+@patch("discord_bridge.bridge.load_config", return_value=("dummy_token", "!", [], 5, 1.0, 1.0, 5))
+def test_bridge_client_dispatches_to_bridge_handlers(mock_load):
+    """Test that discord.py events are routed straight to the Bridge handlers."""
+    bridge = Bridge("config.yaml")
+    assert bridge._client.on_message == bridge._handle_on_message
+    assert bridge._client.on_ready == bridge._handle_on_ready
+
+
+@patch("discord_bridge.bridge.load_config", return_value=("dummy_token", "!", [], 5, 1.0, 1.0, 5))
+def test_bridge_event_loop_policy_falls_back(mock_load):
+    """Test that an unavailable event loop policy falls back to asyncio."""
+    original_policy = asyncio.get_event_loop_policy()
+    with patch("importlib.import_module", side_effect=ImportError):
+        bridge = Bridge("config.yaml", event_loop_policy="uvloop")
+    assert bridge.event_loop_policy == "uvloop"
+    assert asyncio.get_event_loop_policy() is original_policy
+
+
+@patch("discord_bridge.bridge.load_config", return_value=("dummy_token", "!", [], 5, 1.0, 1.0, 5))
+def test_bridge_event_loop_policy_without_policy_class_falls_back(mock_load):
+    """Test that a module lacking EventLoopPolicy is skipped instead of raising."""
+    original_policy = asyncio.get_event_loop_policy()
+    with patch("importlib.import_module", return_value=object()):
+        Bridge("config.yaml", event_loop_policy="uvloop")
+    assert asyncio.get_event_loop_policy() is original_policy
+
+
+@patch("discord_bridge.bridge.load_config", return_value=("dummy_token", "!", [], 5, 1.0, 1.0, 5))
+def test_bridge_rejects_unknown_event_loop_policy(mock_load):
+    """Test that a misspelled or unsupported policy name is an error."""
+    for name in ("uvlop", "json"):
+        with pytest.raises(ConfigurationError, match="Unknown event loop policy"):
+            Bridge("config.yaml", event_loop_policy=name)
+
+
+def test_token_bucket_bursts_then_paces():
+    """Test that the token bucket allows a burst, then spaces attempts."""
+    with patch("discord_bridge.ratelimit.time.monotonic", return_value=100.0) as clock:
+        bucket = TokenBucket(capacity=2, rate=0.5)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        # Bucket is empty: the next token arrives in 1 / rate seconds
+        assert bucket.reserve() == 2.0
+
+        # After waiting, the borrowed token is repaid and the wait repeats
+        clock.return_value = 102.0
+        assert bucket.reserve() == 2.0
@@ -1,3 +1,5 @@
+import asyncio
+import io
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from discord_bridge import SmartMessage, MessageSendError
@@ -5,12 +7,27 @@ import discord
 
 pytestmark = pytest.mark.asyncio
 
+
+@pytest.fixture(autouse=True)
+def reset_channel_state():
+    """Clear the per-channel rate limit buckets and writers between tests."""
+    yield
+    SmartMessage._channel_buckets.clear()
+    SmartMessage._channel_writers.clear()
+    SmartMessage._writer_tasks.clear()
+
+
 @pytest.fixture
 def smart_message():
     """Provides a SmartMessage instance with a mocked original message."""
-    mock_discord_msg = Mock()
+    # spec limits the mocks to real discord.py attributes
+    mock_discord_msg = Mock(spec=discord.Message)
+    mock_discord_msg.content = "!test"
+    mock_discord_msg.author = Mock(spec=discord.Member)
+    mock_discord_msg.channel = Mock(spec=discord.TextChannel)
+    mock_discord_msg.channel.id = 456
     # AsyncMock is needed for async methods like 'send'
-    mock_discord_msg.channel.send = AsyncMock() 
+    mock_discord_msg.channel.send = AsyncMock()
     
     # Attach the mock to the message object itself for reply testing
     mock_discord_msg.reply = AsyncMock()
@@ -22,7 +39,7 @@ async def test_reply_sends_short_message(smart_message):
     await smart_message.reply(reply_text)
 
     # Check that the underlying channel.send was called once with the correct text
-    smart_message._original.channel.send.assert_called_once_with(reply_text)
+    smart_message._channel.send.assert_called_once_with(reply_text)
 
 async def test_reply_splits_long_message(smart_message):
     # Create a long text (e.g., 2001 chars)
@@ -31,11 +48,11 @@ async def test_reply_splits_long_message(smart_message):
     await smart_message.reply(long_text)
 
     # We expect it to be split into two chunks
-    assert smart_message._original.channel.send.call_count == 2
+    assert smart_message._channel.send.call_count == 2
     
     # Check the content of each call
-    first_call_args = smart_message._original.channel.send.call_args_list[0].args
-    second_call_args = smart_message._original.channel.send.call_args_list[1].args
+    first_call_args = smart_message._channel.send.call_args_list[0].args
+    second_call_args = smart_message._channel.send.call_args_list[1].args
 
     assert len(first_call_args[0]) == 2000
     assert first_call_args[0] == "a" * 2000
@@ -45,9 +62,173 @@ async def test_reply_splits_long_message(smart_message):
 
 async def test_reply_wraps_discord_exception(smart_message):
     # Configure the mock to raise a discord.py specific error
-    smart_message._original.channel.send.side_effect = discord.Forbidden(
+    smart_message._channel.send.side_effect = discord.Forbidden(
         Mock(), "Missing Permissions"
     )
 
     with pytest.raises(MessageSendError, match="Failed to send message"):
         await smart_message.reply("This will fail.")
+
+
+async def test_reply_waits_for_send_limiter():
+    mock_discord_msg = Mock()
+    mock_discord_msg.content = "!test"
+    mock_discord_msg.channel.id = 456
+    mock_discord_msg.channel.send = AsyncMock()
+    send_limiter = AsyncMock()
+
+    smart_message = SmartMessage(mock_discord_msg, "!", send_limiter=send_limiter)
+    await smart_message.reply("Rate limited reply")
+
+    send_limiter.assert_awaited_once_with(456)
+    mock_discord_msg.channel.send.assert_called_once_with("Rate limited reply")
+
+
+async def test_reply_splits_at_newline_boundary(smart_message):
+    # A newline shortly before the limit is used as the split point
+    first_part = "a" * 1950
+    second_part = "b" * 100
+    await smart_message.reply(first_part + "\n" + second_part)
+
+    sent = [call.args[0] for call in smart_message._channel.send.call_args_list]
+    assert sent == [first_part, second_part]
+
+
+async def test_reply_with_file_missing_file_raises(smart_message):
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        await smart_message.reply_with_file(file_path="/nonexistent/file.txt")
+
+    smart_message._channel.send.assert_not_called()
+
+
+async def test_reply_with_file_requires_a_source(smart_message):
+    with pytest.raises(ValueError, match="file_path or fp"):
+        await smart_message.reply_with_file(content="No file")
+
+    smart_message._channel.send.assert_not_called()
+
+
+async def test_reply_long_packs_text_into_single_embed(smart_message):
+    long_text = "word " * 1000  # 5000 chars
+
+    await smart_message.reply_long(long_text)
+
+    smart_message._channel.send.assert_called_once()
+    embed = smart_message._channel.send.call_args.kwargs["embed"]
+    assert len(embed.description) <= SmartMessage.EMBED_DESCRIPTION_LIMIT
+    assert all(len(field.value) <= SmartMessage.EMBED_FIELD_LIMIT for field in embed.fields)
+
+
+async def test_reply_long_falls_back_to_chunks_beyond_embed_limit(smart_message):
+    await smart_message.reply_long("a" * 7000)
+
+    assert smart_message._channel.send.call_count == 4
+
+
+def _rate_limited_error(retry_after="2.5"):
+    response = Mock(status=429, reason="Too Many Requests", headers={"Retry-After": retry_after})
+    return discord.HTTPException(response, "You are being rate limited.")
+
+
+async def test_reply_retries_after_rate_limit(smart_message):
+    smart_message._channel.send.side_effect = [_rate_limited_error(), None]
+
+    with patch("discord_bridge.message.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with patch("discord_bridge.message.random.uniform", return_value=0.25):
+            await smart_message.reply("Retry me")
+
+    assert smart_message._channel.send.call_count == 2
+    # Retry-After from the response headers, plus the (patched) jitter
+    mock_sleep.assert_awaited_once_with(2.75)
+
+
+async def test_reply_raises_after_rate_limit_retries_exhausted(smart_message):
+    smart_message._channel.send.side_effect = _rate_limited_error()
+
+    with patch("discord_bridge.message.asyncio.sleep", new_callable=AsyncMock):
+        with pytest.raises(MessageSendError, match="429"):
+            await smart_message.reply("Retry me")
+
+    assert smart_message._channel.send.call_count == SmartMessage.SEND_ATTEMPTS
+
+
+async def test_reply_with_file_sends_attachment(smart_message, tmp_path):
+    path = tmp_path / "report.txt"
+    path.write_text("contents")
+
+    await smart_message.reply_with_file(content="Here you go", file_path=str(path))
+
+    kwargs = smart_message._channel.send.call_args.kwargs
+    assert kwargs["content"] == "Here you go"
+    assert kwargs["file"].filename == "report.txt"
+
+
+async def test_concurrent_replies_are_coalesced(smart_message):
+    await asyncio.gather(smart_message.reply("first"), smart_message.reply("second"))
+
+    smart_message._channel.send.assert_called_once_with("first\nsecond")
+
+
+async def test_cancelled_reply_is_not_sent(smart_message):
+    tasks = [
+        asyncio.create_task(smart_message.reply(text)) for text in ("first", "second", "third")
+    ]
+    # Let every reply queue its text before the writer runs
+    await asyncio.sleep(0)
+    tasks[1].cancel()
+
+    await asyncio.gather(tasks[0], tasks[2])
+
+    assert tasks[1].cancelled()
+    smart_message._channel.send.assert_called_once_with("first\nthird")
+
+
+async def test_failed_chunk_drops_rest_of_reply(smart_message):
+    forbidden = discord.Forbidden(Mock(status=403, reason="Forbidden"), "Missing Access")
+    smart_message._channel.send.side_effect = forbidden
+
+    with pytest.raises(MessageSendError, match="403"):
+        await smart_message.reply("a" * 5000)
+    await asyncio.sleep(0)
+
+    # The remaining chunks are not sent after the first one failed
+    assert smart_message._channel.send.call_count == 1
+
+
+async def test_queued_reply_keeps_channel_when_message_is_recycled(smart_message):
+    original_channel = smart_message._channel
+    original_channel.send.side_effect = [_rate_limited_error(), None]
+    other_msg = Mock(spec=discord.Message)
+    other_msg.content = "!other"
+    other_msg.author = Mock(spec=discord.Member)
+    other_msg.channel = Mock(spec=discord.TextChannel)
+    other_msg.channel.id = 789
+    other_msg.channel.send = AsyncMock()
+
+    async def recycle_during_retry(delay):
+        smart_message.reinit(other_msg, "!")
+
+    with patch("discord_bridge.message.asyncio.sleep", side_effect=recycle_during_retry):
+        await smart_message.reply("Retry me")
+
+    # The retry still goes to the channel the reply was queued for
+    assert original_channel.send.call_count == 2
+    other_msg.channel.send.assert_not_called()
+
+
+async def test_coalesced_send_failure_reaches_every_reply(smart_message):
+    smart_message._channel.send.side_effect = RuntimeError("boom")
+
+    results = await asyncio.gather(
+        smart_message.reply("first"), smart_message.reply("second"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, MessageSendError) for result in results)
+
+
+async def test_reply_with_file_sends_in_memory_file(smart_message):
+    await smart_message.reply_with_file(fp=io.BytesIO(b"hello"), filename="hello.txt")
+
+    sent_file = smart_message._channel.send.call_args.kwargs["file"]
+    assert sent_file.filename == "hello.txt"
+    assert sent_file.fp.read() == b"hello"
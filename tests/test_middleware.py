@@ -0,0 +1,140 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from discord_bridge import MiddlewareContext, MiddlewareManager, rate_limit_middleware
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit_state():
+    """Clear the rate limiter's per-user buckets between tests."""
+    if hasattr(rate_limit_middleware, "_buckets"):
+        del rate_limit_middleware._buckets
+    yield
+
+
+async def test_execute_runs_middleware_in_order_then_handler():
+    manager = MiddlewareManager()
+    calls = []
+
+    @manager.use
+    async def first(ctx, next):
+        calls.append("first:before")
+        await next()
+        calls.append("first:after")
+
+    @manager.use
+    async def second(ctx, next):
+        calls.append("second")
+        await next()
+
+    async def handler(message):
+        calls.append("handler")
+
+    assert await manager.execute(Mock(), handler)
+    assert calls == ["first:before", "second", "handler", "first:after"]
+
+
+async def test_execute_stops_when_cancelled_and_recompiles_on_change():
+    manager = MiddlewareManager()
+    handler = AsyncMock()
+
+    @manager.use
+    async def blocker(ctx, next):
+        ctx.cancelled = True
+
+    assert not await manager.execute(Mock(), handler)
+    handler.assert_not_awaited()
+
+    # Removing the middleware rebuilds the compiled chain
+    manager.remove(blocker)
+    assert await manager.execute(Mock(), handler)
+    handler.assert_awaited_once()
+
+
+async def test_execute_compiles_each_handler_once():
+    manager = MiddlewareManager()
+    first, second = AsyncMock(), AsyncMock()
+
+    @manager.use
+    async def passthrough(ctx, next):
+        await next()
+
+    with patch.object(manager, "_compile", wraps=manager._compile) as compile_spy:
+        for _ in range(2):
+            await manager.execute(Mock(), first)
+            await manager.execute(Mock(), second)
+
+    assert compile_spy.call_count == 2
+    assert first.await_count == second.await_count == 2
+
+
+async def test_execute_bounds_compiled_chain_cache():
+    manager = MiddlewareManager()
+    kept = AsyncMock()
+
+    @manager.use
+    async def passthrough(ctx, next):
+        await next()
+
+    await manager.execute(Mock(), kept)
+    # A new handler object per message, as with a lambda built in the loop
+    for _ in range(3 * MiddlewareManager.COMPILED_CACHE_SIZE):
+        await manager.execute(Mock(), AsyncMock())
+        await manager.execute(Mock(), kept)
+
+    assert len(manager._compiled) == MiddlewareManager.COMPILED_CACHE_SIZE
+    # The handler used on every message stays cached
+    assert kept in manager._compiled
+
+
+def make_context(author_id: int = 123) -> MiddlewareContext:
+    message = Mock()
+    message.author_id = author_id
+    message.reply = AsyncMock()
+    return MiddlewareContext(message=message)
+
+
+async def test_rate_limit_allows_burst_then_blocks():
+    next_handler = AsyncMock()
+
+    with patch("time.monotonic", return_value=100.0):
+        for _ in range(3):
+            ctx = make_context()
+            await rate_limit_middleware(ctx, next_handler, max_requests=3, window_seconds=30.0)
+            assert not ctx.cancelled
+
+        blocked = make_context()
+        await rate_limit_middleware(blocked, next_handler, max_requests=3, window_seconds=30.0)
+
+    assert blocked.cancelled
+    blocked.message.reply.assert_awaited_once()
+    assert next_handler.await_count == 3
+
+
+async def test_rate_limit_refills_over_time():
+    next_handler = AsyncMock()
+
+    with patch("time.monotonic", return_value=100.0):
+        for _ in range(3):
+            await rate_limit_middleware(make_context(), next_handler, max_requests=3, window_seconds=30.0)
+
+    # One token comes back every window_seconds / max_requests seconds
+    with patch("time.monotonic", return_value=110.0):
+        ctx = make_context()
+        await rate_limit_middleware(ctx, next_handler, max_requests=3, window_seconds=30.0)
+
+    assert not ctx.cancelled
+    assert next_handler.await_count == 4
+
+
+async def test_execute_without_middleware_calls_handler_directly():
+    manager = MiddlewareManager()
+    handler = AsyncMock()
+    message = Mock()
+
+    with patch.object(manager, "_compile") as compile_spy:
+        assert await manager.execute(message, handler)
+
+    handler.assert_awaited_once_with(message)
+    compile_spy.assert_not_called()
@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from discord_bridge import CommandRouter
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_message(content: str) -> Mock:
+    message = Mock()
+    message.content = content
+    message.reply = AsyncMock()
+    message.reply_long = AsyncMock()
+    return message
+
+
+@pytest.mark.parametrize(
+    "content,expected_args",
+    [
+        ("echo hello world", "hello world"),
+        ("ECHO   spaced out", "spaced out"),
+        ("echo\nnext line", "next line"),
+        ("echo", ""),
+    ],
+)
+async def test_handle_parses_command_and_args(content, expected_args):
+    router = CommandRouter()
+    handler = AsyncMock()
+    router.command("echo")(handler)
+
+    message = make_message(content)
+    assert await router.handle(message)
+
+    handler.assert_awaited_once_with(message, expected_args)
+
+
+async def test_help_text_updates_after_registration():
+    router = CommandRouter()
+    router.command("hello", description="Say hello")(AsyncMock())
+
+    message = make_message("help")
+    await router.handle(message)
+    assert "`!hello` - Say hello" in message.reply_long.call_args.args[0]
+
+    router.command("bye", description="Say goodbye")(AsyncMock())
+    await router.handle(message)
+    help_text = message.reply_long.call_args.args[0]
+    assert help_text.index("`!bye`") < help_text.index("`!hello`")
+
+
+async def test_reregistering_command_replaces_help_entry():
+    router = CommandRouter()
+    router.command("hello", description="Old")(AsyncMock())
+    router.command("Hello", description="New")(AsyncMock())
+
+    message = make_message("help")
+    await router.handle(message)
+    help_text = message.reply_long.call_args.args[0]
+    assert help_text.count("`!hello`") == 1
+    assert "`!hello` - New" in help_text